@@ -5,8 +5,8 @@ This package contains the main business logic including document processing,
 vector database management, and the research assistant coordinator.
 """
 
-from .document_processor import DocumentProcessor
+from .document_processor import DocumentProcessor, InvalidPdfHeader, InvalidTextEncoding
 from .vector_database import VectorDatabase
 from .research_assistant import ResearchAssistant
 
-__all__ = ["DocumentProcessor", "VectorDatabase", "ResearchAssistant"]
\ No newline at end of file
+__all__ = ["DocumentProcessor", "InvalidPdfHeader", "InvalidTextEncoding", "VectorDatabase", "ResearchAssistant"]
\ No newline at end of file
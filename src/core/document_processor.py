@@ -4,36 +4,231 @@ Document processing module for the AI Research Assistant.
 This module handles extraction of text from various document formats.
 """
 
+import atexit
+import codecs
+import functools
 import logging
-from pathlib import Path
-from typing import Optional, Dict, Any
+import mmap
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from typing import Optional, Dict, Any, Iterator, List, Tuple
 import tempfile
 import os
+import xml.etree.ElementTree as ET
+import zipfile
 
-# Document processing libraries
-import PyPDF2
-import pypdf
-from docx import Document
+from utils.cache import LRUCache, file_digest
+from utils.config import file_suffix, validate_file_size
 
-from utils.config import validate_file_size, validate_file_type
-
-# Set up logging
-logging.basicConfig(level=logging.INFO)
+# Logging is configured by the application entry point
 logger = logging.getLogger(__name__)
 
+# File extensions the processor can extract text from
+SUPPORTED_FORMATS = frozenset({'.pdf', '.docx', '.txt'})
+
+# WordprocessingML element tags used by the streaming DOCX parser
+_W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_W_P = f'{_W_NS}p'
+_W_R = f'{_W_NS}r'
+_W_T = f'{_W_NS}t'
+_W_TAB = f'{_W_NS}tab'
+_W_BR = f'{_W_NS}br'
+_W_CR = f'{_W_NS}cr'
+_W_TBL = f'{_W_NS}tbl'
+_W_TR = f'{_W_NS}tr'
+_W_TC = f'{_W_NS}tc'
+
+# Page-count thresholds for the PDF extraction strategy: fewer than
+# THREAD_PAGE_THRESHOLD pages run sequentially, up to PROCESS_PAGE_THRESHOLD
+# use a thread pool and anything larger is split across processes
+THREAD_PAGE_THRESHOLD = 50
+PROCESS_PAGE_THRESHOLD = 500
+
+# Encodings considered for non-UTF-8 text files without a UTF-16 byte order
+# mark; detection is restricted to these because unrestricted guessing
+# mislabels short Western European text
+FALLBACK_ENCODINGS = ['cp1252', 'latin_1']
+
+# Bytes read per call when streaming text files
+TEXT_READ_BLOCK_SIZE = 1024 * 1024
+
+# Whitespace a text block may end at; each is a word boundary for str.split()
+_BLOCK_SEPARATORS = (' ', '\n', '\t', '\r')
+
+
+class InvalidPdfHeader(Exception):
+    """Raised when a file does not start with the %PDF- signature."""
+    
+    def __init__(self, file_path: str):
+        super().__init__("File is not a valid PDF (missing PDF header)")
+        self.file_path = file_path
+
+
+class InvalidTextEncoding(Exception):
+    """Raised when a text file read as UTF-8 contains an invalid byte sequence."""
+    
+    def __init__(self, file_path: str, position: int):
+        super().__init__(f"File is not valid UTF-8 (invalid byte at offset {position})")
+        self.file_path = file_path
+        self.position = position
+
+
+@contextmanager
+def _map_pdf(file_path: str) -> Iterator[mmap.mmap]:
+    """
+    Memory-map a PDF read-only after checking its header.
+    
+    Args:
+        file_path (str): Path to PDF file
+        
+    Yields:
+        mmap.mmap: Read-only mapping usable as a stream by PyPDF2 and pypdf
+        
+    Raises:
+        InvalidPdfHeader: If the file does not start with %PDF-
+    """
+    with open(file_path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            raise Exception("PDF file is empty (0 bytes)")
+        
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as pdf_map:
+            if pdf_map[:5] != b'%PDF-':
+                raise InvalidPdfHeader(file_path)
+            yield pdf_map
+
+
+@functools.lru_cache(maxsize=1)
+def _process_context() -> multiprocessing.context.BaseContext:
+    """
+    Get the context for page-extraction processes, configuring it on first use.
+    
+    Forking the threaded server could copy locks held by other threads into
+    the children and deadlock them, so workers come from a single-threaded
+    forkserver. It preloads only this module and the PDF readers, not the
+    application entry point. Platforms without forkserver fall back to spawn.
+    
+    Returns:
+        multiprocessing.context.BaseContext: Context for the process pool
+    """
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context('forkserver')
+        context.set_forkserver_preload([__name__, 'pypdf', 'PyPDF2'])
+        return context
+    return multiprocessing.get_context('spawn')
+
+
+def _extract_page_text(page: Any, page_num: int) -> str:
+    """
+    Extract text from a single PDF page, returning "" on failure.
+    
+    Args:
+        page (Any): PyPDF2 or pypdf page object
+        page_num (int): Zero-based page index
+        
+    Returns:
+        str: Extracted page text
+    """
+    try:
+        return page.extract_text() or ""
+    except Exception as page_error:
+        # Skip building the message when warnings are filtered out
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning(f"Failed to extract text from page {page_num + 1}: {page_error}")
+        return ""
+
+
+def _extract_pdf_range(file_path: str, start: int, end: int, reader_module: str = 'pypdf') -> List[str]:
+    """
+    Extract text from pages [start, end) using a private reader.
+    
+    Args:
+        file_path (str): Path to PDF file
+        start (int): First page index (inclusive)
+        end (int): Last page index (exclusive)
+        reader_module (str): Reader implementation ('PyPDF2' or 'pypdf')
+        
+    Returns:
+        List[str]: Text of each page in the range
+    """
+    if reader_module == 'PyPDF2':
+        import PyPDF2
+        reader_cls = PyPDF2.PdfReader
+    else:
+        import pypdf
+        reader_cls = pypdf.PdfReader
+    
+    # Each worker maps the file itself; the pages are shared through the OS
+    # page cache rather than copied into every thread or process
+    with _map_pdf(file_path) as pdf_map:
+        pdf_reader = reader_cls(pdf_map)
+        return [_extract_page_text(pdf_reader.pages[page_num], page_num) for page_num in range(start, end)]
+
+
+def _split_page_range(num_pages: int, parts: int) -> List[Tuple[int, int]]:
+    """
+    Split page indices into contiguous, nearly equal ranges.
+    
+    Args:
+        num_pages (int): Total number of pages
+        parts (int): Number of ranges to produce
+        
+    Returns:
+        List[Tuple[int, int]]: (start, end) pairs covering all pages in order
+    """
+    step, remainder = divmod(num_pages, parts)
+    ranges = []
+    start = 0
+    for i in range(parts):
+        end = start + step + (1 if i < remainder else 0)
+        if end > start:
+            ranges.append((start, end))
+        start = end
+    return ranges
+
 
 class DocumentProcessor:
     """Handles extraction of text from various document formats."""
     
-    def __init__(self, max_file_size_mb: int = 50):
+    # Pre-bound formatter for the per-page header in extracted PDF text
+    _PAGE_TPL = "\n--- Page {} ---\n{}\n".format
+    
+    def __init__(
+        self,
+        max_file_size_mb: int = 50,
+        cache_size: int = 32,
+        cache_ttl: Optional[float] = 3600,
+        max_pdf_workers: Optional[int] = None
+    ):
         """
         Initialize the document processor.
         
         Args:
             max_file_size_mb (int): Maximum file size in MB
+            cache_size (int): Number of extraction results kept in memory (0 disables caching)
+            cache_ttl (Optional[float]): Seconds before a cached extraction expires
+            max_pdf_workers (Optional[int]): Workers used for page extraction (defaults to CPU count, max 8)
         """
         self.max_file_size_mb = max_file_size_mb
-        self.supported_formats = ['.pdf', '.docx', '.txt']
+        self.supported_formats = SUPPORTED_FORMATS
+        self.max_pdf_workers = max_pdf_workers or min(8, os.cpu_count() or 1)
+        
+        # Extraction results keyed by a fingerprint of the file contents and its type
+        self._cache = LRUCache(maxsize=cache_size, ttl=cache_ttl)
+        
+        # Page-extraction processes, started with the first PDF that needs them
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+    
+    def close(self) -> None:
+        """Shut down the page-extraction processes, if any were started."""
+        with self._pool_lock:
+            pool, self._process_pool = self._process_pool, None
+        if pool is not None:
+            atexit.unregister(self.close)
+            pool.shutdown()
     
     def extract_text(self, file_path: str, filename: str) -> Dict[str, Any]:
         """
@@ -50,14 +245,14 @@ class DocumentProcessor:
             'success': False,
             'text': '',
             'filename': filename,
-            'file_type': Path(filename).suffix.lower(),
+            'file_type': file_suffix(filename),
             'error': None,
             'metadata': {}
         }
         
         try:
             # Validate file type
-            if not validate_file_type(filename):
+            if result['file_type'] not in self.supported_formats:
                 result['error'] = f"Unsupported file type: {result['file_type']}"
                 return result
             
@@ -66,8 +261,19 @@ class DocumentProcessor:
                 result['error'] = f"File too large (max {self.max_file_size_mb}MB)"
                 return result
             
+            # Reuse a previous extraction of identical file contents; the type is
+            # part of the key since the same bytes extract differently per format
+            cache_key = (
+                (file_digest(file_path), result['file_type']) if self._cache.maxsize > 0 else None
+            )
+            cached = self._cache.get(cache_key) if cache_key else None
+            
+            if cached is not None:
+                text, metadata = cached
+                metadata = dict(metadata)
+                logger.info(f"Using cached extraction for {filename}")
             # Extract text based on file type
-            if result['file_type'] == '.pdf':
+            elif result['file_type'] == '.pdf':
                 text, metadata = self._extract_pdf_text(file_path)
             elif result['file_type'] == '.docx':
                 text, metadata = self._extract_docx_text(file_path)
@@ -78,6 +284,8 @@ class DocumentProcessor:
                 return result
             
             if text and text.strip():
+                if cache_key and cached is None:
+                    self._cache.set(cache_key, (text, dict(metadata)))
                 result['success'] = True
                 result['text'] = text
                 result['metadata'] = metadata
@@ -85,6 +293,9 @@ class DocumentProcessor:
             else:
                 result['error'] = "No text could be extracted from the document. The file might be scanned, empty, or corrupted."
             
+        except InvalidPdfHeader as e:
+            logger.warning(f"Rejected {filename}: {e}")
+            result['error'] = str(e)
         except Exception as e:
             logger.error(f"Error processing {filename}: {str(e)}")
             result['error'] = str(e)
@@ -105,60 +316,63 @@ class DocumentProcessor:
         metadata = {'pages': 0, 'method': 'unknown'}
         
         # Validate file first
-        if not os.path.exists(file_path):
+        try:
+            file_size = os.stat(file_path).st_size
+        except FileNotFoundError:
             raise Exception(f"PDF file not found: {file_path}")
         
-        file_size = os.path.getsize(file_path)
         if file_size == 0:
             raise Exception("PDF file is empty (0 bytes)")
         
-        # Check if it's a valid PDF by reading header
-        try:
-            with open(file_path, 'rb') as file:
-                header = file.read(5)
-                if not header.startswith(b'%PDF-'):
-                    raise Exception("File is not a valid PDF (missing PDF header)")
-        except Exception as e:
-            if "PDF header" in str(e):
-                raise e
-            raise Exception(f"Cannot read file: {e}")
-        
-        # Try PyPDF2 first
         pypdf2_error = None
-        try:
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
+        pypdf_error = None
+        
+        # Both readers parse the same read-only mapping of the file
+        with _map_pdf(file_path) as pdf_map:
+            # Try PyPDF2 first
+            try:
+                import PyPDF2
+                pdf_reader = PyPDF2.PdfReader(pdf_map)
                 
                 if len(pdf_reader.pages) == 0:
                     raise Exception("PDF has no pages")
                 
-                metadata['pages'] = len(pdf_reader.pages)
-                metadata['method'] = 'PyPDF2'
-                
-                extracted_pages = 0
-                for page_num, page in enumerate(pdf_reader.pages):
-                    try:
-                        page_text = page.extract_text()
+                # Larger PDFs skip PyPDF2 and go straight to the parallel pypdf path
+                if self._choose_pdf_strategy(len(pdf_reader.pages)) == 'seq':
+                    metadata['pages'] = len(pdf_reader.pages)
+                    metadata['method'] = 'PyPDF2'
+                    
+                    page_texts = self._extract_page_texts(file_path, pdf_reader, 'PyPDF2')
+                    
+                    # Retry only the pages PyPDF2 left empty; a full pypdf pass
+                    # below is reserved for when PyPDF2 produced nothing at all
+                    empty_pages = [n for n, page_text in enumerate(page_texts) if not page_text.strip()]
+                    if empty_pages and len(empty_pages) < len(page_texts):
+                        recovered = self._retry_pages_with_pypdf(pdf_map, page_texts, empty_pages)
+                        if recovered:
+                            metadata['method'] = 'PyPDF2+pypdf'
+                            logger.info(f"pypdf recovered text from {recovered}/{len(empty_pages)} empty pages")
+                    
+                    parts = []
+                    for page_num, page_text in enumerate(page_texts):
                         if page_text and page_text.strip():
-                            text += f"\n--- Page {page_num + 1} ---\n{page_text}\n"
-                            extracted_pages += 1
-                    except Exception as page_error:
-                        logger.warning(f"Failed to extract text from page {page_num + 1}: {page_error}")
-                        continue
-                
-                # If we got some text, consider it successful
-                if text.strip():
-                    logger.info(f"PyPDF2: Extracted text from {extracted_pages}/{len(pdf_reader.pages)} pages")
-                    return text.strip(), metadata
+                            parts.append(self._PAGE_TPL(page_num + 1, page_text))
+                    extracted_pages = len(parts)
+                    text = "".join(parts)
+                    
+                    # If we got some text, consider it successful
+                    if text.strip():
+                        logger.info(f"PyPDF2: Extracted text from {extracted_pages}/{len(pdf_reader.pages)} pages")
+                        return text.strip(), metadata
                 
-        except Exception as e:
-            pypdf2_error = str(e)
-            logger.warning(f"PyPDF2 failed: {e}. Trying pypdf...")
-        
-        # Fallback to pypdf
-        try:
-            with open(file_path, 'rb') as file:
-                pdf_reader = pypdf.PdfReader(file)
+            except Exception as e:
+                pypdf2_error = str(e)
+                logger.warning(f"PyPDF2 failed: {e}. Trying pypdf...")
+            
+            # Fallback to pypdf
+            try:
+                import pypdf
+                pdf_reader = pypdf.PdfReader(pdf_map)
                 
                 if len(pdf_reader.pages) == 0:
                     raise Exception("PDF has no pages")
@@ -166,42 +380,183 @@ class DocumentProcessor:
                 metadata['pages'] = len(pdf_reader.pages)
                 metadata['method'] = 'pypdf'
                 
-                extracted_pages = 0
-                text = ""  # Reset text for pypdf attempt
-                
-                for page_num, page in enumerate(pdf_reader.pages):
-                    try:
-                        page_text = page.extract_text()
-                        if page_text and page_text.strip():
-                            text += f"\n--- Page {page_num + 1} ---\n{page_text}\n"
-                            extracted_pages += 1
-                    except Exception as page_error:
-                        logger.warning(f"Failed to extract text from page {page_num + 1}: {page_error}")
-                        continue
+                parts = []
+                page_texts = self._extract_page_texts(file_path, pdf_reader, 'pypdf')
+                for page_num, page_text in enumerate(page_texts):
+                    if page_text and page_text.strip():
+                        parts.append(self._PAGE_TPL(page_num + 1, page_text))
+                extracted_pages = len(parts)
+                text = "".join(parts)  # Replaces any partial PyPDF2 result
                 
                 if text.strip():
                     logger.info(f"pypdf: Extracted text from {extracted_pages}/{len(pdf_reader.pages)} pages")
                     return text.strip(), metadata
                         
-        except Exception as e2:
-            pypdf_error = str(e2)
-            logger.error(f"pypdf also failed: {e2}")
+            except Exception as e2:
+                pypdf_error = str(e2)
+                logger.error(f"pypdf also failed: {e2}")
         
         # If both methods failed or returned no text
         if not text.strip():
             error_msg = f"Both PDF readers failed to extract text. "
             if pypdf2_error:
                 error_msg += f"PyPDF2: {pypdf2_error}. "
-            if 'pypdf_error' in locals():
+            if pypdf_error:
                 error_msg += f"pypdf: {pypdf_error}. "
             error_msg += "This might be a scanned PDF, encrypted PDF, or the text might be embedded as images."
             raise Exception(error_msg)
         
         return text.strip(), metadata
     
+    @contextmanager
+    def open_pdf_pages(self, file_path: str) -> Iterator[Tuple[Iterator[str], Dict[str, Any]]]:
+        """
+        Open a PDF for page-by-page extraction without building the whole document text.
+        
+        Pages are read with pypdf, the reader extract_text() also uses for PDFs
+        too large for the sequential PyPDF2 pass, and the metadata has the
+        same fields it reports.
+        
+        Args:
+            file_path (str): Path to PDF file
+            
+        Yields:
+            Tuple[Iterator[str], Dict[str, Any]]: Text of each non-empty page under
+                the same page header as extract_text(), and the document metadata
+        """
+        if not validate_file_size(file_path, self.max_file_size_mb):
+            raise Exception(f"File too large (max {self.max_file_size_mb}MB)")
+        
+        import pypdf
+        
+        with _map_pdf(file_path) as pdf_map:
+            pdf_reader = pypdf.PdfReader(pdf_map)
+            if len(pdf_reader.pages) == 0:
+                raise Exception("PDF has no pages")
+            
+            metadata = {'pages': len(pdf_reader.pages), 'method': 'pypdf'}
+            yield self._iter_pdf_pages(pdf_reader), metadata
+    
+    def _iter_pdf_pages(self, pdf_reader: Any) -> Iterator[str]:
+        """
+        Yield the formatted text of each non-empty page of an open reader.
+        
+        Args:
+            pdf_reader (Any): Open pypdf reader
+            
+        Yields:
+            str: Page text under its page header
+        """
+        for page_num, page in enumerate(pdf_reader.pages):
+            page_text = _extract_page_text(page, page_num)
+            if page_text.strip():
+                yield self._PAGE_TPL(page_num + 1, page_text)
+    
+    def _retry_pages_with_pypdf(self, pdf_map: mmap.mmap, page_texts: List[str], page_nums: List[int]) -> int:
+        """
+        Re-extract selected pages with pypdf, filling them into page_texts in place.
+        
+        Args:
+            pdf_map (mmap.mmap): Mapping of the PDF already open for PyPDF2
+            page_texts (List[str]): Text of each page, updated in place
+            page_nums (List[int]): Zero-based indices of the pages to retry
+            
+        Returns:
+            int: Number of pages that yielded text on retry
+        """
+        try:
+            import pypdf
+            pdf_reader = pypdf.PdfReader(pdf_map)
+        except Exception as e:
+            logger.warning(f"pypdf could not open the PDF for page retry: {e}")
+            return 0
+        
+        recovered = 0
+        for page_num in page_nums:
+            page_text = _extract_page_text(pdf_reader.pages[page_num], page_num)
+            if page_text.strip():
+                page_texts[page_num] = page_text
+                recovered += 1
+        return recovered
+    
+    def _choose_pdf_strategy(self, num_pages: int) -> str:
+        """
+        Choose how to parallelize page extraction for a PDF of the given size.
+        
+        Args:
+            num_pages (int): Number of pages in the PDF
+            
+        Returns:
+            str: 'seq' (calling thread), 'threads' (thread pool) or 'procs' (process pool)
+        """
+        if num_pages < THREAD_PAGE_THRESHOLD or self.max_pdf_workers <= 1:
+            return 'seq'
+        if num_pages <= PROCESS_PAGE_THRESHOLD:
+            return 'threads'
+        return 'procs'
+    
+    def _extract_page_texts(self, file_path: str, pdf_reader: Any, reader_module: str) -> List[str]:
+        """
+        Extract the text of every page, fanning out to threads or processes for larger PDFs.
+        
+        Args:
+            file_path (str): Path to PDF file
+            pdf_reader (Any): Open reader used for sequential extraction
+            reader_module (str): Reader implementation ('PyPDF2' or 'pypdf')
+            
+        Returns:
+            List[str]: Text of each page in page order ("" for failed pages)
+        """
+        num_pages = len(pdf_reader.pages)
+        strategy = self._choose_pdf_strategy(num_pages)
+        
+        if strategy == 'seq':
+            return [_extract_page_text(page, page_num) for page_num, page in enumerate(pdf_reader.pages)]
+        
+        # Readers are not safe to share across workers, so each worker
+        # opens its own reader over a contiguous range of pages
+        workers = min(self.max_pdf_workers, num_pages)
+        ranges = _split_page_range(num_pages, workers)
+        starts, ends = zip(*ranges)
+        logger.info(f"Extracting {num_pages} pages with {workers} {strategy}")
+        
+        args = ([file_path] * len(ranges), starts, ends, [reader_module] * len(ranges))
+        
+        if strategy == 'threads':
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(_extract_pdf_range, *args))
+        else:
+            try:
+                results = list(self._get_process_pool().map(_extract_pdf_range, *args))
+            except BrokenProcessPool:
+                # A crashed worker breaks the pool; the next PDF starts a new one
+                self.close()
+                raise
+        
+        return [page_text for chunk in results for page_text in chunk]
+    
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """
+        Get the page-extraction process pool, starting it on first use.
+        
+        The pool is kept for later PDFs, so starting the forkserver and its
+        workers is paid once rather than for every document.
+        
+        Returns:
+            ProcessPoolExecutor: Pool of max_pdf_workers processes
+        """
+        with self._pool_lock:
+            if self._process_pool is None:
+                self._process_pool = ProcessPoolExecutor(
+                    max_workers=self.max_pdf_workers,
+                    mp_context=_process_context()
+                )
+                atexit.register(self.close)
+            return self._process_pool
+    
     def _extract_docx_text(self, file_path: str) -> tuple[str, Dict[str, Any]]:
         """
-        Extract text from DOCX files.
+        Extract text from DOCX files by streaming the document XML, with python-docx fallback.
         
         Args:
             file_path (str): Path to DOCX file
@@ -216,34 +571,20 @@ class DocumentProcessor:
             if os.path.getsize(file_path) == 0:
                 raise Exception("DOCX file is empty (0 bytes)")
             
-            doc = Document(file_path)
-            text = ""
-            paragraph_count = 0
-            
-            # Extract text from paragraphs
-            for paragraph in doc.paragraphs:
-                if paragraph.text.strip():
-                    text += paragraph.text + "\n"
-                    paragraph_count += 1
-            
-            # Extract text from tables
-            table_count = 0
-            for table in doc.tables:
-                table_count += 1
-                text += f"\n--- Table {table_count} ---\n"
-                for row in table.rows:
-                    row_text = []
-                    for cell in row.cells:
-                        cell_text = cell.text.strip()
-                        if cell_text:
-                            row_text.append(cell_text)
-                    if row_text:
-                        text += " | ".join(row_text) + "\n"
+            try:
+                parts, paragraph_count, table_count = self._parse_docx_xml(file_path)
+                method = 'docx-xml'
+            except (KeyError, zipfile.BadZipFile, ET.ParseError) as xml_error:
+                logger.warning(f"Streaming DOCX parse failed: {xml_error}. Trying python-docx...")
+                parts, paragraph_count, table_count = self._parse_docx_document(file_path)
+                method = 'python-docx'
+            
+            text = "".join(parts)
             
             metadata = {
                 'paragraphs': paragraph_count,
                 'tables': table_count,
-                'method': 'python-docx'
+                'method': method
             }
             
             if not text.strip():
@@ -256,6 +597,125 @@ class DocumentProcessor:
                 raise e
             raise Exception(f"Failed to extract text from DOCX: {e}")
     
+    def _parse_docx_xml(self, file_path: str) -> tuple[List[str], int, int]:
+        """
+        Collect DOCX text in one pass over word/document.xml.
+        
+        Produces the same layout as the python-docx path: body paragraphs
+        first, then each top-level table with cells joined by " | ".
+        
+        Args:
+            file_path (str): Path to DOCX file
+            
+        Returns:
+            tuple[List[str], int, int]: Text fragments, paragraph count and table count
+        """
+        parts = []
+        table_parts = []
+        paragraph_count = 0
+        table_count = 0
+        
+        paragraph_depth = 0
+        run_depth = 0
+        table_depth = 0
+        runs: List[str] = []
+        cell_paragraphs: List[str] = []
+        row_cells: List[str] = []
+        
+        with zipfile.ZipFile(file_path) as archive, archive.open('word/document.xml') as document_xml:
+            for event, elem in ET.iterparse(document_xml, events=('start', 'end')):
+                tag = elem.tag
+                
+                if event == 'start':
+                    if tag == _W_P:
+                        paragraph_depth += 1
+                    elif tag == _W_R:
+                        run_depth += 1
+                    elif tag == _W_TBL:
+                        table_depth += 1
+                        if table_depth == 1:
+                            table_count += 1
+                            table_parts.append(f"\n--- Table {table_count} ---\n")
+                    continue
+                
+                # Tab and break elements also appear in paragraph properties,
+                # so only those inside a run contribute text
+                if run_depth and tag == _W_T:
+                    if elem.text:
+                        runs.append(elem.text)
+                elif run_depth and tag == _W_TAB:
+                    runs.append("\t")
+                elif run_depth and tag in (_W_BR, _W_CR):
+                    runs.append("\n")
+                elif tag == _W_R:
+                    run_depth -= 1
+                elif tag == _W_P:
+                    paragraph_depth -= 1
+                    if paragraph_depth == 0:
+                        paragraph_text = "".join(runs)
+                        runs.clear()
+                        if table_depth == 0:
+                            if paragraph_text.strip():
+                                parts.append(paragraph_text + "\n")
+                                paragraph_count += 1
+                        elif table_depth == 1:
+                            cell_paragraphs.append(paragraph_text)
+                        elem.clear()
+                elif tag == _W_TC and table_depth == 1:
+                    cell_text = "\n".join(cell_paragraphs).strip()
+                    cell_paragraphs.clear()
+                    if cell_text:
+                        row_cells.append(cell_text)
+                elif tag == _W_TR and table_depth == 1:
+                    if row_cells:
+                        table_parts.append(" | ".join(row_cells) + "\n")
+                    row_cells.clear()
+                elif tag == _W_TBL:
+                    table_depth -= 1
+                    if table_depth == 0:
+                        elem.clear()
+        
+        parts.extend(table_parts)
+        return parts, paragraph_count, table_count
+    
+    def _parse_docx_document(self, file_path: str) -> tuple[List[str], int, int]:
+        """
+        Collect DOCX text through the python-docx object model.
+        
+        Args:
+            file_path (str): Path to DOCX file
+            
+        Returns:
+            tuple[List[str], int, int]: Text fragments, paragraph count and table count
+        """
+        from docx import Document
+        
+        doc = Document(file_path)
+        parts = []
+        paragraph_count = 0
+        
+        # Extract text from paragraphs
+        for paragraph in doc.paragraphs:
+            if paragraph.text.strip():
+                parts.append(paragraph.text + "\n")
+                paragraph_count += 1
+        
+        # Extract text from tables
+        table_count = 0
+        for table in doc.tables:
+            table_count += 1
+            parts.append(f"\n--- Table {table_count} ---\n")
+            for row in table.rows:
+                row_text = []
+                for cell in row.cells:
+                    cell_text = cell.text.strip()
+                    if cell_text:
+                        row_text.append(cell_text)
+                if row_text:
+                    parts.append(" | ".join(row_text) + "\n")
+        
+        return parts, paragraph_count, table_count
+    
     def _extract_txt_text(self, file_path: str) -> tuple[str, Dict[str, Any]]:
         """
         Extract text from TXT files.
@@ -277,27 +737,179 @@ class DocumentProcessor:
                 'method': 'plain_text'
             }
         
-        # Try different encodings
-        encodings = ['utf-8', 'utf-16', 'latin-1', 'cp1252', 'iso-8859-1']
+        # UTF-8 is decoded block by block; only other encodings need the
+        # whole file in memory for detection
+        try:
+            text, encoding = ''.join(self.iter_text_blocks(file_path)), 'utf-8'
+        except InvalidTextEncoding:
+            try:
+                with open(file_path, 'rb') as file:
+                    raw = file.read()
+            except OSError as e:
+                raise Exception(f"Failed to read text file: {e}")
+            text, encoding = self._decode_text(raw)
+        except OSError as e:
+            raise Exception(f"Failed to read text file: {e}")
+        
+        text = text.strip()
+        
+        metadata = {
+            'encoding': encoding,
+            'lines': text.count('\n') + 1 if text else 0,
+            'method': 'plain_text'
+        }
+        
+        return text, metadata
+    
+    @contextmanager
+    def open_text_blocks(self, file_path: str) -> Iterator[Tuple[Iterator[str], Dict[str, Any]]]:
+        """
+        Open a UTF-8 text file for block-by-block extraction.
         
-        for encoding in encodings:
+        The file is scanned once up front, so a file that is not UTF-8 fails
+        before any of it is consumed and the metadata matches extract_text().
+        
+        Args:
+            file_path (str): Path to TXT file
+            
+        Yields:
+            Tuple[Iterator[str], Dict[str, Any]]: Successive blocks of the text and
+                the document metadata
+            
+        Raises:
+            InvalidTextEncoding: If the file is not valid UTF-8
+        """
+        if not validate_file_size(file_path, self.max_file_size_mb):
+            raise Exception(f"File too large (max {self.max_file_size_mb}MB)")
+        
+        metadata = {
+            'encoding': 'utf-8',
+            'lines': self._count_text_lines(file_path),
+            'method': 'plain_text'
+        }
+        yield self.iter_text_blocks(file_path), metadata
+    
+    def _count_text_lines(self, file_path: str) -> int:
+        """
+        Count the lines of the stripped text, as _extract_txt_text does, one block at a time.
+        
+        Args:
+            file_path (str): Path to TXT file
+            
+        Returns:
+            int: Number of lines between the first and last non-blank characters
+        """
+        newlines = 0
+        # Newlines before the first and after the last non-blank character
+        leading = 0
+        trailing = 0
+        seen_text = False
+        
+        for block in self.iter_text_blocks(file_path):
+            block_newlines = block.count('\n')
+            newlines += block_newlines
+            
+            head = block.lstrip()
+            if not head:
+                if seen_text:
+                    trailing += block_newlines
+                else:
+                    leading += block_newlines
+                continue
+            
+            if not seen_text:
+                leading += block.count('\n', 0, len(block) - len(head))
+                seen_text = True
+            trailing = block.count('\n', len(block.rstrip()))
+        
+        return newlines - leading - trailing + 1 if seen_text else 0
+    
+    def iter_text_blocks(self, file_path: str) -> Iterator[str]:
+        """
+        Yield the text of a UTF-8 file in blocks that never split a word.
+        
+        Only a run of more than TEXT_READ_BLOCK_SIZE bytes without whitespace
+        is split: a block with no whitespace at all is yielded as it is rather
+        than carried into the next one.
+        
+        Args:
+            file_path (str): Path to TXT file
+            
+        Yields:
+            str: Successive pieces of the text, each ending at whitespace
+            
+        Raises:
+            InvalidTextEncoding: If the file is not valid UTF-8
+        """
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        offset = 0
+        
+        def decode(data: bytes, final: bool = False) -> str:
+            nonlocal offset
+            # Bytes of a split character held by the decoder count towards
+            # the error position
+            pending = len(decoder.getstate()[0])
             try:
-                with open(file_path, 'r', encoding=encoding) as file:
-                    text = file.read()
-                    
-                metadata = {
-                    'encoding': encoding,
-                    'lines': len(text.splitlines()) if text else 0,
-                    'method': 'plain_text'
-                }
-                
-                return text.strip(), metadata
+                text = decoder.decode(data, final)
+            except UnicodeDecodeError as e:
+                raise InvalidTextEncoding(file_path, offset - pending + e.start) from e
+            offset += len(data)
+            return text
+        
+        carry = ''
+        with open(file_path, 'rb') as file:
+            for block in iter(lambda: file.read(TEXT_READ_BLOCK_SIZE), b''):
+                text = carry + decode(block)
                 
+                # Hold back a trailing partial word until the next block
+                cut = max(text.rfind(separator) for separator in _BLOCK_SEPARATORS) + 1
+                if cut:
+                    yield text[:cut]
+                    carry = text[cut:]
+                else:
+                    if text:
+                        yield text
+                    carry = ''
+        
+        carry += decode(b'', final=True)
+        if carry:
+            yield carry
+    
+    def _decode_text(self, raw: bytes) -> tuple[str, str]:
+        """
+        Decode raw text bytes, detecting the encoding in a single pass.
+        
+        Args:
+            raw (bytes): File contents
+            
+        Returns:
+            tuple[str, str]: Decoded text and the encoding used
+        """
+        # Most text files are UTF-8, which needs no detection
+        try:
+            return raw.decode('utf-8'), 'utf-8'
+        except UnicodeDecodeError:
+            pass
+        
+        # UTF-16 is only trusted with a byte order mark; otherwise any
+        # even-length 8-bit text would decode as UTF-16 without error
+        if raw.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+            try:
+                return raw.decode('utf-16'), 'utf_16'
+            except UnicodeDecodeError:
+                pass
+        
+        import charset_normalizer
+        
+        best = charset_normalizer.from_bytes(raw, cp_isolation=FALLBACK_ENCODINGS).best()
+        if best is not None:
+            return str(best), best.encoding
+        
+        # Fall back to common encodings if detection was inconclusive
+        for encoding in FALLBACK_ENCODINGS:
+            try:
+                return raw.decode(encoding), encoding
             except UnicodeDecodeError:
-                continue
-            except Exception as e:
-                if encoding == encodings[-1]:  # Last encoding attempt
-                    raise Exception(f"Failed to read text file: {e}")
                 continue
         
         raise Exception("Failed to decode text file with any supported encoding")
@@ -309,7 +921,7 @@ class DocumentProcessor:
         Returns:
             list[str]: List of supported file extensions
         """
-        return self.supported_formats.copy()
+        return sorted(self.supported_formats)
     
     def is_supported_format(self, filename: str) -> bool:
         """
@@ -323,4 +935,4 @@ class DocumentProcessor:
         """
         if not filename:
             return False
-        return Path(filename).suffix.lower() in self.supported_formats
\ No newline at end of file
+        return file_suffix(filename) in self.supported_formats
\ No newline at end of file
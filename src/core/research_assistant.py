@@ -4,8 +4,12 @@ Research Assistant module for the AI Research Assistant.
 This module coordinates document processing, vector search, and AI responses.
 """
 
+import hashlib
+import json
 import logging
-from typing import List, Tuple, Dict, Any, Optional
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 from datetime import datetime
 import tempfile
 import os
@@ -15,12 +19,50 @@ from groq import Groq
 
 from core.document_processor import DocumentProcessor
 from core.vector_database import VectorDatabase
-from utils.config import ConfigManager
+from utils.cache import DiskCache, LRUCache
+from utils.config import ConfigManager, file_suffix
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
+# Logging is configured by the application entry point
 logger = logging.getLogger(__name__)
 
+# Upper bound on files extracted concurrently during a batch upload
+MAX_INTAKE_WORKERS = 4
+
+# Upper bound on Groq requests in flight for one batch of questions
+MAX_BATCH_ANSWER_WORKERS = 8
+
+# Formats that can be streamed into the vector database without full extraction
+STREAMED_FORMATS = ('.pdf', '.txt')
+
+# Fraction of the upload progress bar covered by parsing; embedding and storing take the rest
+PARSE_PROGRESS_SHARE = 0.5
+
+# Matches any non-whitespace character
+_NON_BLANK = re.compile(r'\S')
+
+# Instructions shared by every chat request; kept separate from the
+# retrieved context so the prompt prefix is identical across queries
+STATIC_SYSTEM_PROMPT = (
+    "You are an AI research assistant. Use the provided context to answer the question.\n"
+    "If the context is not sufficient, say so clearly instead of guessing."
+)
+
+# Most recent question/answer turns sent along with a question
+MAX_HISTORY_TURNS = 10
+
+# Once a conversation has more turns than this, the older ones are condensed
+# into a memo and only the last MEMO_KEEP_TURNS are kept verbatim
+MEMO_TRIGGER_TURNS = 8
+MEMO_KEEP_TURNS = 6
+MEMO_MAX_TOKENS = 300
+MEMO_PREFIX = "Prior conversation memo:\n"
+
+SUMMARY_SYSTEM_PROMPT = (
+    "Summarize the conversation below into a compact memo for an AI research assistant. "
+    "Keep the user's goals, the facts and conclusions established so far, and any open "
+    "questions. Use short bullet points."
+)
+
 
 class ResearchAssistant:
     """Main class that coordinates document processing, vector search, and AI responses."""
@@ -36,13 +78,29 @@ class ResearchAssistant:
         
         # Initialize components
         self.doc_processor = DocumentProcessor(
-            max_file_size_mb=self.config.get('max_file_size_mb', 50)
+            max_file_size_mb=self.config.get('max_file_size_mb', 50),
+            cache_size=self.config.get('extraction_cache_size', 32)
         )
         
+        # Embeddings and answers persisted across runs; a size of 0 disables it
+        self.disk_cache: Optional[DiskCache] = None
+        if self.config.get('cache_size_mb', 1024) > 0:
+            self.disk_cache = DiskCache(
+                str(Path(self.config.get('cache_dir', './data/cache')) / 'cache.sqlite3'),
+                max_size_mb=self.config.get('cache_size_mb', 1024),
+                max_entries=self.config.get('cache_entries', 10000)
+            )
+        
         self.vector_db = VectorDatabase(
             db_path=self.config.get('vector_db_path', ':memory:'),
             collection_name=self.config.get('collection_name', 'documents'),
-            embedding_model=self.config.get('embedding_model', 'all-MiniLM-L6-v2')
+            embedding_model=self.config.get('embedding_model', 'all-MiniLM-L6-v2'),
+            quantization=self.config.get('embedding_quantization'),
+            embedding_cache_size=self.config.get('embedding_cache_size', 4096),
+            query_cache_size=self.config.get('search_cache_size', 256),
+            qdrant_url=self.config.get('qdrant_url'),
+            grpc_port=self.config.get('qdrant_grpc_port', 6334),
+            disk_cache=self.disk_cache
         )
         
         # Initialize Groq client
@@ -53,21 +111,72 @@ class ResearchAssistant:
         self.groq_client = Groq(api_key=groq_api_key)
         self.groq_model = self.config.get('groq_model', 'llama3-8b-8192')
         
+        # Chunking settings shared by every document, read once
+        self._chunk_size = self.config.get('chunk_size', 500)
+        self._chunk_overlap = self.config.get('chunk_overlap', 50)
+        self._base_meta = {
+            'chunk_size': self._chunk_size,
+            'chunk_overlap': self._chunk_overlap
+        }
+        
+        # Files above this size are streamed instead of extracted whole
+        self._stream_threshold_bytes = self.config.get('stream_threshold_mb', 20) * 1024 * 1024
+        
         # Conversation history (in-memory for this session)
         self.conversation_history = []
         
+        # Answers are sampled, so replaying a previous one for the same prompt
+        # is opt-in; entries are keyed by a hash of the model and the full prompt
+        self._cache_responses = self.config.get('cache_responses', False)
+        self._response_cache_ttl = self.config.get('response_cache_ttl', 86400)
+        self._response_cache = LRUCache(
+            maxsize=self.config.get('response_cache_size', 128),
+            ttl=self._response_cache_ttl
+        )
+        
+        # Order prompt messages so the prefix stays identical across turns
+        self._preserve_prompt_cache = self.config.get('preserve_prompt_cache', True)
+        
+        # Emit retrieved chunks in document order rather than by score
+        self._stable_chunk_order = self.config.get('stable_chunk_order', True)
+        
         logger.info("Research Assistant initialized successfully")
     
 
-    def process_documents(self, files: List[Any]) -> str:
+    def process_documents(
+        self,
+        files: List[Any],
+        progress: Optional[Callable[[float, str], None]] = None
+    ) -> str:
+        """
+        Process uploaded files and add them to the vector database.
+        
+        PDF and UTF-8 text files larger than stream_threshold_mb are streamed
+        into the database a page or block at a time, so their full text is
+        never held in memory. Streaming gives up the extraction cache and
+        parallel PDF parsing, so every other file, and any file whose stream
+        fails, goes through extract_text() in parallel and is then embedded
+        and stored in one batch.
+        
+        Args:
+            files (List[Any]): Uploaded files or paths
+            progress (Optional[Callable[[float, str], None]]): Called with the completed
+                fraction and a description as each stage advances
+            
+        Returns:
+            str: Status message for every file plus a summary
+        """
         if not files:
             return "No files uploaded."
         
-        results = []
-        successful_uploads = 0
+        report = progress or (lambda fraction, description: None)
+        
         total_files = len(files)
+        results: List[Optional[str]] = [None] * total_files
+        streamable = []
+        buffered = []
         
-        for file_idx, file in enumerate(files, 1):
+        for file_idx, file in enumerate(files):
             try:
                 # Gradio gives either a string path or an UploadedFile object
                 if isinstance(file, str) and os.path.exists(file):
@@ -84,20 +193,86 @@ class ResearchAssistant:
                 if file_size == 0:
                     raise Exception("Uploaded file is empty.")
                 
-                # Process the document
-                result = self.process_single_document(file_path, filename)
-                results.append(result)
-                
-                if "successfully processed" in result.lower():
-                    successful_uploads += 1
-                    logger.info(f"✅ Successfully processed: {filename}")
+                if self._should_stream(filename, file_size):
+                    streamable.append((file_idx, file_path, filename))
                 else:
-                    logger.error(f"❌ Failed to process: {filename}")
+                    buffered.append((file_idx, file_path, filename))
                 
             except Exception as e:
                 error_msg = f"❌ Error processing '{getattr(file, 'name', str(file))}': {e}"
                 logger.error(error_msg)
-                results.append(error_msg)
+                results[file_idx] = error_msg
+        
+        total_prepared = len(streamable) + len(buffered)
+        completed = 0
+        report(0.0, "Parsing documents")
+        
+        with self.vector_db.bulk():
+            # Stream documents straight into the database, several at a time
+            if streamable:
+                max_workers = min(MAX_INTAKE_WORKERS, len(streamable))
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    futures = {
+                        executor.submit(self._stream_document, file_path, filename): (file_idx, file_path, filename)
+                        for file_idx, file_path, filename in streamable
+                    }
+                    for future in as_completed(futures):
+                        file_idx, file_path, filename = futures[future]
+                        db_result = future.result()
+                        if db_result['success']:
+                            results[file_idx] = self._format_db_result(filename, db_result)
+                            completed += 1
+                            report(PARSE_PROGRESS_SHARE * completed / total_prepared, f"Stored {filename}")
+                            logger.info(f"✅ Successfully processed: {filename}")
+                        else:
+                            # The buffered path retries with the PyPDF2 reader,
+                            # encoding detection and detailed errors
+                            logger.warning(f"Streaming failed for {filename}: {db_result['error']}. Retrying buffered extraction...")
+                            buffered.append(futures[future])
+            
+            # Extract the remaining documents in parallel, keeping results in upload order
+            extracted = []
+            if buffered:
+                max_workers = min(MAX_INTAKE_WORKERS, len(buffered))
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    futures = {
+                        executor.submit(self._extract_document, file_path, filename): (file_idx, filename)
+                        for file_idx, file_path, filename in buffered
+                    }
+                    for future in as_completed(futures):
+                        file_idx, filename = futures[future]
+                        text, metadata, error_msg = future.result()
+                        completed += 1
+                        report(PARSE_PROGRESS_SHARE * completed / total_prepared, f"Parsed {filename}")
+                        
+                        if error_msg:
+                            results[file_idx] = error_msg
+                            logger.error(f"❌ Failed to process: {filename}")
+                        else:
+                            extracted.append((file_idx, filename, text, metadata))
+            
+            # Embed and store all extracted documents in a single batch
+            if extracted:
+                extracted.sort(key=lambda item: item[0])
+                report(PARSE_PROGRESS_SHARE, f"Embedding and storing {len(extracted)} documents")
+                db_results = self.vector_db.add_documents(
+                    [text for _, _, text, _ in extracted],
+                    [metadata for _, _, _, metadata in extracted]
+                )
+                
+                for (file_idx, filename, _, _), db_result in zip(extracted, db_results):
+                    results[file_idx] = self._format_db_result(filename, db_result)
+                    
+                    if db_result['success']:
+                        logger.info(f"✅ Successfully processed: {filename}")
+                    else:
+                        logger.error(f"❌ Failed to process: {filename}")
+        
+        report(1.0, "Done")
+        
+        successful_uploads = sum(
+            1 for result in results if "successfully processed" in result.lower()
+        )
         
         # Summary
         if successful_uploads > 0:
@@ -121,6 +296,93 @@ class ResearchAssistant:
         Returns:
             str: Status message about the processing
         """
+        try:
+            # Large PDFs are streamed page by page and UTF-8 text block by block;
+            # the buffered path below remains as a fallback with the PyPDF2
+            # reader, encoding detection and detailed errors
+            if self._should_stream(filename, os.path.getsize(file_path)):
+                db_result = self._stream_document(file_path, filename)
+                if db_result['success']:
+                    return self._format_db_result(filename, db_result)
+                logger.warning(f"Streaming failed for {filename}: {db_result['error']}. Retrying buffered extraction...")
+            
+            extracted_text, metadata, error_msg = self._extract_document(file_path, filename)
+            if error_msg:
+                return error_msg
+            
+            # Add to vector database
+            db_result = self.vector_db.add_document(extracted_text, metadata)
+            return self._format_db_result(filename, db_result)
+            
+        except Exception as e:
+            logger.error(f"Error processing {filename}: {e}")
+            return f"❌ Error processing '{filename}': {str(e)}"
+    
+    def _should_stream(self, filename: str, file_size: int) -> bool:
+        """Whether a file is large enough to stream into the vector database instead of extracting it whole."""
+        return file_size > self._stream_threshold_bytes and file_suffix(filename) in STREAMED_FORMATS
+    
+    def _stream_document(self, file_path: str, filename: str) -> Dict[str, Any]:
+        """
+        Stream a PDF or text file into the vector database.
+        
+        Args:
+            file_path (str): Path to the document file
+            filename (str): Original filename
+            
+        Returns:
+            Dict[str, Any]: Result returned by the vector database
+        """
+        file_type = file_suffix(filename)
+        try:
+            if file_type == '.pdf':
+                stream = self.doc_processor.open_pdf_pages(file_path)
+            else:
+                stream = self.doc_processor.open_text_blocks(file_path)
+            
+            logger.info(f"Streaming into the vector database: {filename}")
+            with stream as (segments, extra_metadata):
+                metadata = self._build_metadata(filename, file_type, extra_metadata)
+                return self.vector_db.add_document_stream(segments, metadata)
+        except Exception as e:
+            return {'success': False, 'error': str(e), 'chunks_added': 0}
+    
+    def _build_metadata(self, filename: str, file_type: str, extra_metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the metadata stored with each chunk of a document.
+        
+        Args:
+            filename (str): Original filename
+            file_type (str): File extension
+            extra_metadata (Dict[str, Any]): Extractor-specific metadata
+            
+        Returns:
+            Dict[str, Any]: Document metadata for the vector database
+        """
+        return {
+            **self._base_meta,
+            'filename': filename,
+            'file_type': file_type,
+            'upload_time': datetime.now().isoformat(),
+            'extra_metadata': extra_metadata
+        }
+    
+    def _extract_document(
+        self,
+        file_path: str,
+        filename: str
+    ) -> Tuple[Optional[str], Optional[Dict[str, Any]], Optional[str]]:
+        """
+        Extract text from a document and prepare its vector database metadata.
+        
+        Args:
+            file_path (str): Path to the document file
+            filename (str): Original filename
+            
+        Returns:
+            Tuple[Optional[str], Optional[Dict[str, Any]], Optional[str]]:
+                Extracted text and metadata, or an error message on failure
+        """
         try:
             logger.info(f"Starting text extraction for: {filename}")
             
@@ -130,39 +392,44 @@ class ResearchAssistant:
             if not extraction_result['success']:
                 error_msg = f"❌ Failed to process '{filename}': {extraction_result['error']}"
                 logger.error(error_msg)
-                return error_msg
+                return None, None, error_msg
             
             # Check if we got meaningful text
             extracted_text = extraction_result['text']
-            # Count meaningful lines instead of characters
-            lines = [line.strip() for line in extracted_text.splitlines() if line.strip()]
-            if not lines:
-                return f"❌ '{filename}' appears to be empty or contains no meaningful lines to process."
+            # A single non-whitespace character proves there is something to index
+            if not _NON_BLANK.search(extracted_text):
+                return None, None, f"❌ '{filename}' appears to be empty or contains no meaningful lines to process."
 
             
             # Prepare metadata
-            metadata = {
-                'filename': filename,
-                'file_type': extraction_result.get('file_type', 'unknown'),
-                'upload_time': datetime.now().isoformat(),
-                'chunk_size': self.config.get('chunk_size', 500),
-                'chunk_overlap': self.config.get('chunk_overlap', 50),
-                'extra_metadata': extraction_result.get('metadata', {})
-            }
-            
-            # Add to vector database
-            db_result = self.vector_db.add_document(extracted_text, metadata)
+            metadata = self._build_metadata(
+                filename,
+                extraction_result.get('file_type', 'unknown'),
+                extraction_result.get('metadata', {})
+            )
             
-            if db_result['success']:
-                return (f"✅ Successfully processed '{filename}': "
-                        f"{db_result['chunks_added']} chunks added "
-                        f"({db_result['total_characters']} characters)")
-            else:
-                return f"❌ Failed to add '{filename}' to database: {db_result['error']}"
+            return extracted_text, metadata, None
             
         except Exception as e:
             logger.error(f"Error processing {filename}: {e}")
-            return f"❌ Error processing '{filename}': {str(e)}"
+            return None, None, f"❌ Error processing '{filename}': {str(e)}"
+    
+    def _format_db_result(self, filename: str, db_result: Dict[str, Any]) -> str:
+        """
+        Format the status message for a document added to the vector database.
+        
+        Args:
+            filename (str): Original filename
+            db_result (Dict[str, Any]): Result returned by the vector database
+            
+        Returns:
+            str: Status message about the processing
+        """
+        if db_result['success']:
+            return (f"✅ Successfully processed '{filename}': "
+                    f"{db_result['chunks_added']} chunks added "
+                    f"({db_result['total_characters']} characters)")
+        return f"❌ Failed to add '{filename}' to database: {db_result['error']}"
     
     # --- All other methods from older file (generate_response, _build_context, etc.) ---
     # This includes: generate_response, _build_context, _build_conversation_context,
@@ -175,6 +442,14 @@ class ResearchAssistant:
     def get_database_stats(self) -> Dict[str, Any]:
         return self.vector_db.get_database_stats()
 
+    def clear_cache(self) -> None:
+        """Drop every cached embedding, search result and answer, in memory and on disk."""
+        self._response_cache.clear()
+        self.vector_db.clear_cache()
+        if self.disk_cache is not None:
+            self.disk_cache.clear()
+        logger.info("Caches cleared")
+
     def clear_database(self) -> bool:
         return self.vector_db.clear_database()
 
@@ -188,44 +463,265 @@ class ResearchAssistant:
         """
         Generate an AI response based on the query and conversation history.
         """
+        return "".join(self.generate_response_stream(query, history)).strip()
+
+    def generate_responses(self, queries: List[str]) -> List[str]:
+        """
+        Answer several independent questions at once.
+        
+        The queries are embedded together in one model call; the Groq API has
+        no batched chat endpoint, so the completions are requested concurrently.
+        
+        Args:
+            queries (List[str]): User questions, each answered without history
+            
+        Returns:
+            List[str]: Answers in the same order as the queries
+        """
+        if not queries:
+            return []
+        
         try:
-            # 🔹 Use search_similar instead of non-existent search()
+            self.vector_db.warm_query_embeddings(queries)
+        except Exception as e:
+            # Each search embeds its own query if the batched pass failed
+            logger.warning(f"Batched query embedding failed: {e}")
+        
+        max_workers = min(MAX_BATCH_ANSWER_WORKERS, len(queries))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.generate_response, queries))
+
+    def build_messages(
+        self,
+        query: str,
+        history: Optional[List[Any]],
+        retrieved: List[Dict[str, Any]]
+    ) -> List[Dict[str, str]]:
+        """
+        Assemble the chat messages for a question.
+        
+        The static instructions always come first. With preserve_prompt_cache
+        the earlier turns follow them, so the prefix only grows between turns
+        and providers with prefix caching can reuse it; the freshly retrieved
+        context, which changes every turn, goes after the history.
+        
+        With stable_chunk_order the chunks are sorted by document and position
+        and each is wrapped in a tag carrying a digest of its text, so a chunk
+        retrieved again renders to the same tokens in the same relative place.
+        
+        Args:
+            query (str): User question
+            history (Optional[List[Any]]): Previous turns, as (question, answer)
+                pairs or role/content messages
+            retrieved (List[Dict[str, Any]]): Search results used as context
+            
+        Returns:
+            List[Dict[str, str]]: Messages for the chat completion request
+        """
+        if self._stable_chunk_order:
+            context_texts = [
+                f"<chunk id={self._chunk_digest(doc['text'])}>\n{doc['text']}\n</chunk>"
+                for doc in sorted(
+                    retrieved, key=lambda doc: (doc.get("document_id", ""), doc.get("chunk_id", 0))
+                )
+            ]
+        else:
+            context_texts = [doc["text"] for doc in retrieved]
+        context = "\n\n".join(context_texts) if context_texts else "No relevant context found."
+        context_message = {"role": "system", "content": f"Context:\n{context}"}
+        
+        # The leading memo of condensed earlier turns is always kept; the recent
+        # turns are cut at a user message, so no answer loses its question
+        history_messages = self._history_messages(history)
+        memo_end = 0
+        while memo_end < len(history_messages) and history_messages[memo_end]["role"] == "system":
+            memo_end += 1
+        turn_starts = self._turn_starts(history_messages, memo_end)
+        window_start = turn_starts[-MAX_HISTORY_TURNS:][0] if turn_starts else len(history_messages)
+        history_messages = history_messages[:memo_end] + history_messages[window_start:]
+        
+        messages = [{"role": "system", "content": STATIC_SYSTEM_PROMPT}]
+        if self._preserve_prompt_cache:
+            messages += history_messages
+            messages.append(context_message)
+        else:
+            messages.append(context_message)
+            messages += history_messages
+        messages.append({"role": "user", "content": f"Question: {query}"})
+        return messages
+    
+    @staticmethod
+    def _history_messages(history: Optional[List[Any]]) -> List[Dict[str, str]]:
+        """
+        Normalize conversation history into role/content messages.
+        
+        Args:
+            history (Optional[List[Any]]): Turns as (question, answer) pairs or
+                role/content messages
+            
+        Returns:
+            List[Dict[str, str]]: History as chat messages
+        """
+        messages = []
+        for turn in history or []:
+            if isinstance(turn, dict):
+                messages.append({"role": turn["role"], "content": turn["content"]})
+                continue
+            question, answer = turn
+            if question:
+                messages.append({"role": "user", "content": question})
+            if answer:
+                messages.append({"role": "assistant", "content": answer})
+        return messages
+    
+    @staticmethod
+    def _turn_starts(messages: List[Dict[str, str]], start: int = 0) -> List[int]:
+        """
+        Find where each question/answer turn begins.
+        
+        Args:
+            messages (List[Dict[str, str]]): Role/content messages
+            start (int): Index to start looking from
+            
+        Returns:
+            List[int]: Index of the user message opening each turn
+        """
+        return [i for i in range(start, len(messages)) if messages[i]["role"] == "user"]
+    
+    def summarize(self, history: List[Any]) -> str:
+        """
+        Condense conversation turns into a short memo.
+        
+        An existing memo in the history is folded into the new one.
+        
+        Args:
+            history (List[Any]): Turns to summarize, in any form build_messages accepts
+            
+        Returns:
+            str: Memo text
+        """
+        transcript = "\n\n".join(
+            f"{message['role']}: {message['content']}" for message in self._history_messages(history)
+        )
+        response = self.groq_client.chat.completions.create(
+            model=self.groq_model,
+            messages=[
+                {"role": "system", "content": SUMMARY_SYSTEM_PROMPT},
+                {"role": "user", "content": transcript}
+            ],
+            max_tokens=MEMO_MAX_TOKENS,
+            temperature=0.2,
+        )
+        return response.choices[0].message.content.strip()
+    
+    def compact_history(self, history: List[Any]) -> List[Dict[str, str]]:
+        """
+        Replace older turns with a memo once the conversation grows long.
+        
+        The memo is only rewritten when the turn count passes
+        MEMO_TRIGGER_TURNS, so between rewrites the prompt prefix stays
+        identical and remains cacheable.
+        
+        Args:
+            history (List[Any]): Conversation so far, possibly starting with a memo
+            
+        Returns:
+            List[Dict[str, str]]: History to send with the next question
+        """
+        messages = self._history_messages(history)
+        turn_starts = self._turn_starts(messages)
+        if len(turn_starts) <= MEMO_TRIGGER_TURNS:
+            return messages
+        
+        split = turn_starts[-MEMO_KEEP_TURNS]
+        try:
+            summary = self.summarize(messages[:split])
+        except Exception as e:
+            # Keep the full history; build_messages still bounds what is sent
+            logger.warning(f"Could not summarize conversation history: {e}")
+            return messages
+        return [{"role": "system", "content": MEMO_PREFIX + summary}] + messages[split:]
+    
+    @staticmethod
+    def _chunk_digest(text: str) -> str:
+        """Content-derived chunk label, identical for the same text in every prompt."""
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=8).hexdigest()
+    
+    def generate_response_stream(
+        self,
+        query: str,
+        history: Optional[List[Dict[str, str]]] = None,
+        raise_errors: bool = False
+    ) -> Iterator[str]:
+        """
+        Generate an AI response, yielding text as it arrives from Groq.
+
+        Closing the generator early cancels the request; the answer is only
+        cached and added to the conversation history once it completes.
+
+        Args:
+            query (str): User question
+            history (Optional[List[Dict[str, str]]]): Previous conversation turns
+            raise_errors (bool): Re-raise failures instead of yielding an error
+                message as part of the answer
+
+        Yields:
+            str: Successive pieces of the answer
+        """
+        try:
+            # Results are cached by the vector database, which drops them on every write
             search_results = self.vector_db.search_similar(query, limit=5)
+            messages = self.build_messages(query, history, search_results)
 
-            # Build context string
-            context_texts = [doc["text"] for doc in search_results]
-            context = "\n\n".join(context_texts) if context_texts else "No relevant context found."
+            # With cache_responses, an identical prompt replays the previous
+            # answer instead of sampling a new one from Groq
+            cache_key = None
+            answer = None
+            if self._cache_responses:
+                cache_key = hashlib.blake2b(
+                    f"{self.groq_model}\0{json.dumps(messages)}".encode("utf-8"),
+                    digest_size=16
+                ).hexdigest()
+                answer = self._response_cache.get(cache_key)
+                if answer is None and self.disk_cache is not None:
+                    answer = self.disk_cache.get(f"resp:{cache_key}")
+                    if answer is not None:
+                        self._response_cache.set(cache_key, answer)
 
-            # Build the prompt for Groq
-            system_prompt = (
-                "You are an AI research assistant. Use the following context to answer the question.\n"
-                "If the context is not sufficient, say so clearly instead of guessing.\n"
-                f"Context:\n{context}"
-            )
+            if answer is not None:
+                yield answer
+            else:
+                stream = self.groq_client.chat.completions.create(
+                    model=self.groq_model,
+                    messages=messages,
+                    max_tokens=500,
+                    temperature=0.7,
+                    stream=True,
+                )
 
-            user_prompt = f"Question: {query}"
-
-            # Call Groq LLM
-            response = self.groq_client.chat.completions.create(
-                model=self.groq_model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ],
-                max_tokens=500,
-                temperature=0.7,
-            )
+                chunks = []
+                try:
+                    for event in stream:
+                        delta = event.choices[0].delta.content
+                        if delta:
+                            chunks.append(delta)
+                            yield delta
+                finally:
+                    # Releases the HTTP connection if the caller stopped early
+                    if hasattr(stream, "close"):
+                        stream.close()
 
-            # 🔹 Groq returns choices with message content
-            answer = response.choices[0].message.content.strip()
+                answer = "".join(chunks).strip()
+                if cache_key is not None:
+                    self._response_cache.set(cache_key, answer)
+                    if self.disk_cache is not None:
+                        self.disk_cache.set(f"resp:{cache_key}", answer, ttl=self._response_cache_ttl)
 
             # Save to conversation history
             self.conversation_history.append({"query": query, "answer": answer})
 
-            return answer
-
         except Exception as e:
             logger.error(f"Error generating response: {e}")
-            return f"❌ Error generating response: {str(e)}"
-
-
+            if raise_errors:
+                raise
+            yield f"❌ Error generating response: {str(e)}"
@@ -4,21 +4,113 @@ Vector database module for the AI Research Assistant.
 This module manages vector database operations using Qdrant for document storage and retrieval.
 """
 
+import hashlib
 import logging
+import os
+import threading
 import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import islice
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple
 
+import numpy as np
 from qdrant_client import QdrantClient
-from qdrant_client.models import Distance, VectorParams, PointStruct, Filter, FieldCondition, MatchValue
+from qdrant_client.models import (
+    Distance, VectorParams, Batch, Filter, FieldCondition, MatchValue, OptimizersConfigDiff,
+    ScalarQuantization, ScalarQuantizationConfig, ScalarType, SearchParams, QuantizationSearchParams,
+    PayloadSelectorInclude, FilterSelector, PointIdsList
+)
 from sentence_transformers import SentenceTransformer
 import torch
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
+from utils.cache import DiskCache, LRUCache
+
+# Logging is configured by the application entry point
 logger = logging.getLogger(__name__)
 
+# Output dimensions of common embedding models, known before the model loads
+KNOWN_EMBEDDING_DIMS = {
+    "all-MiniLM-L6-v2": 384,
+    "sentence-transformers/all-MiniLM-L6-v2": 384,
+    "all-MiniLM-L12-v2": 384,
+    "all-mpnet-base-v2": 768,
+}
+
+# Number of chunks passed through the embedding model per forward pass
+ENCODE_BATCH_SIZE = 128
+
+# Above this many texts, CPU encoding is split across a small thread pool of
+# at most ENCODE_WORKERS threads, when the machine has cores to spare
+ENCODE_SHARD_THRESHOLD = 2048
+ENCODE_WORKERS = 4
+
+# Pending chunks that trigger an embed + write when streaming a document
+STREAM_FLUSH_CHUNKS = 32
+
+# Chunks embedded and written per step when adding documents
+ENCODE_WINDOW_CHUNKS = 256
+
+# Points per upsert request; larger writes are split into batches of this size
+UPLOAD_BATCH_SIZE = 64
+
+# Kilobytes of unindexed vectors per segment before Qdrant builds the HNSW
+# graph (server default); restored after bulk mode when the collection's own
+# threshold is unknown
+DEFAULT_INDEXING_THRESHOLD = 20000
+
+# Vectors are kept as int8 in RAM for search; the FP32 originals are used to rescore
+VECTOR_QUANTIZATION = ScalarQuantization(
+    scalar=ScalarQuantizationConfig(type=ScalarType.INT8, always_ram=True)
+)
+SEARCH_PARAMS = SearchParams(
+    quantization=QuantizationSearchParams(rescore=True, oversampling=2.0)
+)
+
+# Seconds a cached search result stays valid (writes invalidate it sooner)
+RESULT_CACHE_TTL = 300
+
+# Cosine similarity above which a new query reuses a recent query's results
+NEAR_DUPLICATE_SIMILARITY = 0.97
+
+# Points fetched per scroll request, and the payload fields document stats need
+SCROLL_PAGE_SIZE = 1000
+STATS_PAYLOAD_FIELDS = ["document_id", "document_name", "file_type", "upload_time"]
+
+
+def _random_uuids(count: int) -> List[str]:
+    """
+    Generate random (version 4) UUID strings from a single read of the OS entropy source.
+    
+    Args:
+        count (int): Number of UUIDs to generate
+        
+    Returns:
+        List[str]: UUID strings
+    """
+    rand = os.urandom(16 * count)
+    return [str(uuid.UUID(bytes=rand[i:i + 16], version=4)) for i in range(0, 16 * count, 16)]
+
+
+def _encode_shard_count() -> int:
+    """
+    Choose how many threads a large CPU encode is split across.
+    
+    Each forward pass already runs torch.get_num_threads() intra-op threads,
+    so shards are only added for cores those threads leave idle; on a single
+    CPU there is nothing to overlap and encoding is never sharded.
+    
+    Returns:
+        int: Number of shards (1 disables sharding)
+    """
+    cpus = os.cpu_count() or 1
+    if cpus <= 1:
+        return 1
+    return max(1, min(ENCODE_WORKERS, cpus // max(1, torch.get_num_threads())))
+
 
 class VectorDatabase:
     """Manages vector database operations using Qdrant for document storage and retrieval."""
@@ -27,7 +119,15 @@ class VectorDatabase:
         self, 
         db_path: str = ":memory:", 
         collection_name: str = "documents",
-        embedding_model: str = "all-MiniLM-L6-v2"
+        embedding_model: str = "all-MiniLM-L6-v2",
+        upload_parallel: int = 4,
+        bulk_mode: bool = False,
+        quantization: Optional[str] = None,
+        embedding_cache_size: int = 4096,
+        query_cache_size: int = 256,
+        qdrant_url: Optional[str] = None,
+        grpc_port: int = 6334,
+        disk_cache: Optional[DiskCache] = None
     ):
         """
         Initialize the vector database.
@@ -36,46 +136,333 @@ class VectorDatabase:
             db_path (str): Path to the database (":memory:" for in-memory)
             collection_name (str): Name of the collection
             embedding_model (str): Name of the embedding model to use
+            upload_parallel (int): Concurrent upsert requests used for large uploads to a server
+            bulk_mode (bool): Create the collection with indexing disabled until end_bulk()
+            quantization (Optional[str]): "int8" to quantize the embedding model on CPU
+            embedding_cache_size (int): Maximum number of chunk embeddings kept in memory
+            query_cache_size (int): Maximum number of query embeddings and search results kept
+            qdrant_url (Optional[str]): URL of a Qdrant server to use instead of db_path
+            grpc_port (int): gRPC port of the Qdrant server
+            disk_cache (Optional[DiskCache]): Persistent cache for chunk embeddings
         """
         self.db_path = db_path
         self.collection_name = collection_name
         self.embedding_model_name = embedding_model
+        self.upload_parallel = upload_parallel
+        self.bulk_mode = bulk_mode
+        self._bulk_depth = 1 if bulk_mode else 0
+        self._bulk_lock = threading.Lock()
+        # Threshold the collection had before bulk mode suspended indexing
+        self._saved_indexing_threshold: Optional[int] = None
+        
+        # Embeddings keyed by content hash + model + precision, so re-indexed
+        # text is not re-encoded; the suffix is set once the model has loaded
+        self._embed_cache = LRUCache(maxsize=embedding_cache_size)
+        self._embed_key_suffix = b""
+        self._disk_cache = disk_cache
+        
+        # Search caches: query text -> embedding, and search parameters -> results.
+        # Recent query vectors allow near-identical queries to reuse results.
+        self._query_embed_cache = LRUCache(maxsize=query_cache_size)
+        self._result_cache = LRUCache(maxsize=query_cache_size, ttl=RESULT_CACHE_TTL)
+        self._recent_queries: "deque[Tuple[np.ndarray, Hashable, Hashable]]" = deque(maxlen=64)
+        self._recent_lock = threading.Lock()
+        
+        # The local Qdrant client is not safe for concurrent writes
+        self._write_lock = threading.Lock()
         
-        # Initialize Qdrant client
-        if db_path == ":memory:":
+        # Point IDs of documents added by this instance, so they can be deleted
+        # by ID; other documents fall back to a payload filter
+        self._point_index: Dict[str, List[str]] = {}
+        
+        # Initialize Qdrant client; a server is reached over gRPC, which keeps
+        # one HTTP/2 connection open and sends vectors as protobuf floats
+        if qdrant_url:
+            self.client = QdrantClient(url=qdrant_url, grpc_port=grpc_port, prefer_grpc=True)
+        elif db_path == ":memory:":
             self.client = QdrantClient(":memory:")
         else:
             Path(db_path).mkdir(parents=True, exist_ok=True)
             self.client = QdrantClient(path=db_path)
         
+        # Batches of a large write are sent as concurrent upserts over the same
+        # client connection; the local client applies writes one at a time
+        self._upload_pool: Optional[ThreadPoolExecutor] = None
+        if qdrant_url and upload_parallel > 1:
+            self._upload_pool = ThreadPoolExecutor(
+                max_workers=upload_parallel, thread_name_prefix="upload"
+            )
+        
         # Initialize embedding model
-        logger.info(f"Loading embedding model: {embedding_model}")
         device = "cuda" if torch.cuda.is_available() else "cpu"
-        self.embedding_model = SentenceTransformer(embedding_model, device=device)
-        self.embedding_dim = self.embedding_model.get_sentence_embedding_dimension()
+        self._device = device
+        self._encode_shards = _encode_shard_count()
+        self._encode_pool = ThreadPoolExecutor(max_workers=self._encode_shards, thread_name_prefix="encode")
+        
+        # The model loads in the background while the collection is prepared;
+        # for well-known models the dimension is available without waiting
+        self._model_future = self._encode_pool.submit(
+            self._load_embedding_model, embedding_model, device, quantization
+        )
+        self.embedding_dim = KNOWN_EMBEDDING_DIMS.get(embedding_model)
+        if self.embedding_dim is None:
+            self.embedding_dim = self.embedding_model.get_sentence_embedding_dimension()
         
         # Initialize collection
         self._initialize_collection()
         
         logger.info(f"Vector database initialized with {self.embedding_dim}D embeddings")
     
+    @property
+    def embedding_model(self) -> SentenceTransformer:
+        """SentenceTransformer: The embedding model, waiting for it to finish loading if needed."""
+        return self._model_future.result()
+    
+    def _load_embedding_model(
+        self, model_name: str, device: str, quantization: Optional[str]
+    ) -> SentenceTransformer:
+        """
+        Load the embedding model and apply the requested precision.
+        
+        Args:
+            model_name (str): Name of the embedding model
+            device (str): Device to load the model on
+            quantization (Optional[str]): Quantization mode, if any
+            
+        Returns:
+            SentenceTransformer: The loaded model
+            
+        Raises:
+            ValueError: If the model's dimension differs from the one assumed at startup
+        """
+        logger.info(f"Loading embedding model: {model_name}")
+        model = SentenceTransformer(model_name, device=device)
+        precision = "fp32"
+        if quantization:
+            if self._quantize_embedding_model(model, quantization, device):
+                precision = quantization
+        elif device == "cuda":
+            # Half precision doubles tensor-core throughput with negligible accuracy loss
+            model = model.half()
+            precision = "fp16"
+        
+        # Embeddings from another precision must not be served from the caches
+        self._embed_key_suffix = f"|{model_name}|{precision}".encode()
+        
+        expected_dim = KNOWN_EMBEDDING_DIMS.get(model_name)
+        actual_dim = model.get_sentence_embedding_dimension()
+        if expected_dim is not None and actual_dim != expected_dim:
+            raise ValueError(
+                f"Embedding model {model_name} produces {actual_dim}D vectors, expected {expected_dim}D"
+            )
+        
+        logger.info(f"Embedding model loaded: {model_name}")
+        return model
+    
+    def _quantize_embedding_model(
+        self, model: SentenceTransformer, quantization: str, device: str
+    ) -> bool:
+        """
+        Quantize the embedding model's linear layers in place.
+        
+        Args:
+            model (SentenceTransformer): Model to quantize
+            quantization (str): Quantization mode (only "int8" is supported)
+            device (str): Device the model was loaded on
+            
+        Returns:
+            bool: True if the model was quantized, False if it stays FP32
+        """
+        if quantization != "int8":
+            logger.warning(f"Unsupported embedding quantization '{quantization}', using FP32")
+            return False
+        if device != "cpu":
+            logger.info("Skipping int8 quantization on GPU")
+            return False
+        
+        try:
+            torch.quantization.quantize_dynamic(
+                model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+            )
+            logger.info("Quantized embedding model to int8")
+            return True
+        except Exception as e:
+            logger.warning(f"Could not quantize embedding model, using FP32: {e}")
+            return False
+    
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed texts, reusing cached embeddings of previously seen texts.
+        
+        Args:
+            texts (List[str]): Texts to embed
+            
+        Returns:
+            np.ndarray: Unit-length float32 embeddings, one row per text
+        """
+        # The key suffix names the precision, known only once the model has loaded
+        self._model_future.result()
+        keys = [
+            hashlib.blake2b(text.encode(), digest_size=16).digest() + self._embed_key_suffix
+            for text in texts
+        ]
+        rows = [self._embed_cache.get(key) for key in keys]
+        missing = [i for i, row in enumerate(rows) if row is None]
+        
+        # Second tier: embeddings persisted by earlier runs
+        if missing and self._disk_cache is not None:
+            stored = self._disk_cache.get_many("emb:" + keys[i].hex() for i in missing)
+            if stored:
+                still_missing = []
+                for i in missing:
+                    row = stored.get("emb:" + keys[i].hex())
+                    if row is None:
+                        still_missing.append(i)
+                    else:
+                        rows[i] = row
+                        self._embed_cache.set(keys[i], row)
+                missing = still_missing
+        
+        if missing:
+            embeddings = self._encode_uncached([texts[i] for i in missing])
+            fresh = {}
+            for i, row in zip(missing, embeddings):
+                rows[i] = row.copy()
+                self._embed_cache.set(keys[i], rows[i])
+                fresh["emb:" + keys[i].hex()] = rows[i]
+            if self._disk_cache is not None:
+                self._disk_cache.set_many(fresh)
+            if len(missing) == len(texts):
+                return embeddings
+        
+        if not rows:
+            return np.zeros((0, self.embedding_dim), dtype=np.float32)
+        return np.stack(rows)
+    
+    def _encode_uncached(self, texts: List[str]) -> np.ndarray:
+        """
+        Run texts through the embedding model, sharding large CPU workloads.
+        
+        Args:
+            texts (List[str]): Texts to embed
+            
+        Returns:
+            np.ndarray: Unit-length float32 embeddings, one row per text
+        """
+        def encode(batch: List[str]) -> np.ndarray:
+            embeddings = self.embedding_model.encode(
+                batch,
+                batch_size=ENCODE_BATCH_SIZE,
+                show_progress_bar=False,
+                convert_to_numpy=True,
+                normalize_embeddings=True
+            )
+            # Qdrant expects float32 vectors; FP16 models return half precision
+            return embeddings.astype(np.float32, copy=False)
+        
+        if self._device != "cpu" or self._encode_shards <= 1 or len(texts) <= ENCODE_SHARD_THRESHOLD:
+            return encode(texts)
+        
+        # torch releases the GIL inside forward passes, so shards of one shared
+        # model overlap their tokenization and pooling with each other's matmuls
+        shard_size = -(-len(texts) // self._encode_shards)
+        shards = [texts[i:i + shard_size] for i in range(0, len(texts), shard_size)]
+        return np.concatenate(list(self._encode_pool.map(encode, shards)))
+    
     def _initialize_collection(self) -> None:
         """Initialize the Qdrant collection if it doesn't exist."""
         try:
             # Check if collection exists
             self.client.get_collection(self.collection_name)
             logger.info(f"Collection '{self.collection_name}' already exists")
+            if self.bulk_mode:
+                self._saved_indexing_threshold = self._get_indexing_threshold()
+                self._set_indexing_threshold(0)
         except Exception:
             # Create collection if it doesn't exist
+            optimizers_config = OptimizersConfigDiff(indexing_threshold=0) if self.bulk_mode else None
             self.client.create_collection(
                 collection_name=self.collection_name,
+                # Embeddings are unit length, so dot product equals cosine
+                # similarity without the per-candidate norm computations
                 vectors_config=VectorParams(
                     size=self.embedding_dim,
-                    distance=Distance.COSINE
-                )
+                    distance=Distance.DOT
+                ),
+                optimizers_config=optimizers_config,
+                quantization_config=VECTOR_QUANTIZATION
             )
             logger.info(f"Created collection '{self.collection_name}' with {self.embedding_dim}D vectors")
     
+    def begin_bulk(self) -> None:
+        """
+        Suspend HNSW indexing so that a large ingest builds the index once.
+        
+        Calls may be nested; indexing resumes when the outermost block ends.
+        """
+        with self._bulk_lock:
+            self._bulk_depth += 1
+            if self._bulk_depth == 1:
+                self._saved_indexing_threshold = self._get_indexing_threshold()
+                self._set_indexing_threshold(0)
+    
+    def end_bulk(self) -> None:
+        """Resume HNSW indexing after begin_bulk()."""
+        with self._bulk_lock:
+            if self._bulk_depth == 0:
+                return
+            self._bulk_depth -= 1
+            if self._bulk_depth == 0:
+                self.bulk_mode = False
+                threshold = self._saved_indexing_threshold
+                self._saved_indexing_threshold = None
+                self._set_indexing_threshold(
+                    DEFAULT_INDEXING_THRESHOLD if threshold is None else threshold
+                )
+    
+    @contextmanager
+    def bulk(self) -> Iterator["VectorDatabase"]:
+        """
+        Context manager that defers indexing for the writes inside it.
+        
+        Yields:
+            VectorDatabase: This database
+        """
+        self.begin_bulk()
+        try:
+            yield self
+        finally:
+            self.end_bulk()
+    
+    def _get_indexing_threshold(self) -> Optional[int]:
+        """
+        Read the collection's current indexing threshold.
+        
+        Returns:
+            Optional[int]: Threshold in kilobytes, or None if it could not be read
+        """
+        try:
+            info = self.client.get_collection(self.collection_name)
+            return info.config.optimizer_config.indexing_threshold
+        except Exception as e:
+            logger.warning(f"Could not read indexing threshold: {e}")
+            return None
+    
+    def _set_indexing_threshold(self, threshold: int) -> None:
+        """
+        Update the collection's indexing threshold.
+        
+        Args:
+            threshold (int): Kilobytes of unindexed vectors allowed before indexing (0 disables it)
+        """
+        try:
+            self.client.update_collection(
+                collection_name=self.collection_name,
+                optimizer_config=OptimizersConfigDiff(indexing_threshold=threshold)
+            )
+        except Exception as e:
+            logger.warning(f"Could not set indexing threshold to {threshold}: {e}")
+    
     def chunk_text(self, text: str, chunk_size: int = 500, overlap: int = 50) -> List[str]:
         """
         Split text into overlapping chunks for better retrieval.
@@ -88,30 +475,48 @@ class VectorDatabase:
         Returns:
             List[str]: List of text chunks
         """
+        return list(self.iter_chunks(text, chunk_size, overlap))
+    
+    def iter_chunks(self, text: str, chunk_size: int = 500, overlap: int = 50) -> Iterator[str]:
+        """
+        Lazily split text into the same overlapping chunks as chunk_text().
+        
+        Args:
+            text (str): Text to chunk
+            chunk_size (int): Maximum words per chunk
+            overlap (int): Number of overlapping words between chunks
+            
+        Yields:
+            str: Successive text chunks
+        """
+        if overlap >= chunk_size:
+            raise ValueError("chunk_overlap must be smaller than chunk_size")
+        
         if not text.strip():
-            return []
+            return
         
         words = text.split()
         if len(words) <= chunk_size:
-            return [text]
-        
-        chunks = []
-        for i in range(0, len(words), chunk_size - overlap):
-            chunk_words = words[i:i + chunk_size]
-            chunk = ' '.join(chunk_words)
-            if chunk.strip():
-                chunks.append(chunk.strip())
-                
-            # Break if we've reached the end
-            if i + chunk_size >= len(words):
-                break
+            yield text
+            return
         
-        return chunks
+        # Words from split() carry no whitespace, so each join is already a
+        # stripped, non-empty chunk; the range ends at the first window that
+        # reaches the last word. split() and join() both run in C, which beats
+        # slicing the original text at word offsets found with re.finditer.
+        join = ' '.join
+        stride = chunk_size - overlap
+        last_start = len(words) - chunk_size
+        for i in range(0, last_start + stride, stride):
+            yield join(words[i:i + chunk_size])
     
     def add_document(self, text: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
         """
         Add a document to the vector database.
         
+        Chunks are embedded and written ENCODE_WINDOW_CHUNKS at a time, so a
+        large document never holds all of its chunks and embeddings at once.
+        
         Args:
             text (str): Document text
             metadata (Dict[str, Any]): Document metadata
@@ -119,78 +524,356 @@ class VectorDatabase:
         Returns:
             Dict[str, Any]: Result information
         """
-        try:
-            if not text.strip():
-                return {
-                    'success': False,
-                    'error': 'Empty text provided',
-                    'chunks_added': 0
-                }
+        if not text.strip():
+            return {
+                'success': False,
+                'error': 'Empty text provided',
+                'chunks_added': 0
+            }
+        
+        chunks = self.iter_chunks(
+            text,
+            metadata.get('chunk_size', 500),
+            metadata.get('chunk_overlap', 50)
+        )
+        result = self._add_chunk_stream(chunks, metadata, ENCODE_WINDOW_CHUNKS)
+        if result['success']:
+            result['total_characters'] = len(text)
+        return result
+    
+    def add_documents(self, texts: List[str], metadatas: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Add several documents, embedding and writing their chunks together.
+        
+        The chunks of all documents are embedded and written ENCODE_WINDOW_CHUNKS
+        at a time, so only one window of embeddings is held in memory.
+        
+        Args:
+            texts (List[str]): Document texts
+            metadatas (List[Dict[str, Any]]): Metadata for each document, in the same order
             
-            # Generate chunks
-            chunks = self.chunk_text(
-                text, 
-                metadata.get('chunk_size', 500),
-                metadata.get('chunk_overlap', 50)
-            )
+        Returns:
+            List[Dict[str, Any]]: Result information for each document
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(texts)
+        
+        try:
+            # Chunks of every document in one flat list; each span records
+            # (document index, offset of its first chunk, number of chunks)
+            all_chunks: List[str] = []
+            spans = []
             
-            if not chunks:
-                return {
-                    'success': False,
-                    'error': 'No chunks generated from text',
-                    'chunks_added': 0
-                }
+            for doc_idx, (text, metadata) in enumerate(zip(texts, metadatas)):
+                if not text.strip():
+                    results[doc_idx] = {
+                        'success': False,
+                        'error': 'Empty text provided',
+                        'chunks_added': 0
+                    }
+                    continue
+                
+                # Generate chunks
+                chunks = self.chunk_text(
+                    text, 
+                    metadata.get('chunk_size', 500),
+                    metadata.get('chunk_overlap', 50)
+                )
+                
+                if not chunks:
+                    results[doc_idx] = {
+                        'success': False,
+                        'error': 'No chunks generated from text',
+                        'chunks_added': 0
+                    }
+                    continue
+                
+                spans.append((doc_idx, len(all_chunks), len(chunks)))
+                all_chunks.extend(chunks)
             
-            # Generate embeddings for all chunks
-            logger.info(f"Generating embeddings for {len(chunks)} chunks...")
-            embeddings = self.embedding_model.encode(chunks, show_progress_bar=True)
+            if not all_chunks:
+                return results
             
-            # Create points for insertion
-            points = []
-            document_id = str(uuid.uuid4())
+            # Create payloads for insertion
+            payloads = []
+            added = []
             
-            for i, (chunk, embedding) in enumerate(zip(chunks, embeddings)):
-                point_id = str(uuid.uuid4())
+            for doc_idx, start, count in spans:
+                document_id = str(uuid.uuid4())
+                payloads.extend(self._build_payloads(
+                    all_chunks[start:start + count],
+                    document_id,
+                    metadatas[doc_idx],
+                    first_chunk_id=0,
+                    chunk_count=count
+                ))
                 
-                point = PointStruct(
-                    id=point_id,
-                    vector=embedding.tolist(),
-                    payload={
-                        "text": chunk,
-                        "chunk_id": i,
-                        "document_id": document_id,
-                        "document_name": metadata.get("filename", "unknown"),
-                        "file_type": metadata.get("file_type", "unknown"),
-                        "upload_time": metadata.get("upload_time", datetime.now().isoformat()),
-                        "chunk_count": len(chunks),
-                        **metadata.get("extra_metadata", {})
+                added.append((doc_idx, {
+                    'success': True,
+                    'chunks_added': count,
+                    'document_id': document_id,
+                    'total_characters': len(texts[doc_idx])
+                }))
+            
+            # Generate embeddings and insert points one window at a time
+            logger.info(f"Generating embeddings for {len(all_chunks)} chunks from {len(spans)} documents...")
+            point_ids: List[str] = []
+            try:
+                for start in range(0, len(all_chunks), ENCODE_WINDOW_CHUNKS):
+                    end = start + ENCODE_WINDOW_CHUNKS
+                    point_ids.extend(
+                        self._write_points(self._encode(all_chunks[start:end]), payloads[start:end])
+                    )
+            except Exception:
+                # Remove the windows already written so no document is left partial
+                if point_ids:
+                    with self._write_lock:
+                        self.client.delete(
+                            collection_name=self.collection_name,
+                            points_selector=PointIdsList(points=point_ids)
+                        )
+                raise
+            
+            for (doc_idx, start, count), (_, result) in zip(spans, added):
+                self._point_index[result['document_id']] = point_ids[start:start + count]
+                results[doc_idx] = result
+            
+            logger.info(f"Successfully added {len(payloads)} chunks to vector database")
+            
+        except Exception as e:
+            logger.error(f"Error adding documents to vector database: {e}")
+            for doc_idx, result in enumerate(results):
+                if result is None:
+                    results[doc_idx] = {
+                        'success': False,
+                        'error': str(e),
+                        'chunks_added': 0
                     }
+        
+        return results
+    
+    def add_document_stream(
+        self,
+        segments: Iterable[str],
+        metadata: Dict[str, Any],
+        flush_size: int = STREAM_FLUSH_CHUNKS
+    ) -> Dict[str, Any]:
+        """
+        Add a document whose text arrives in pieces, such as one PDF page at a time.
+        
+        Chunks are embedded and written whenever flush_size of them are pending,
+        so only a small window of the document is held in memory.
+        
+        Args:
+            segments (Iterable[str]): Successive pieces of the document text
+            metadata (Dict[str, Any]): Document metadata
+            flush_size (int): Number of pending chunks that triggers a write
+            
+        Returns:
+            Dict[str, Any]: Result information
+        """
+        total_characters = 0
+        
+        def counted(segments: Iterable[str]) -> Iterator[str]:
+            nonlocal total_characters
+            for segment in segments:
+                total_characters += len(segment)
+                yield segment
+        
+        chunks = self._iter_segment_chunks(
+            counted(segments),
+            metadata.get('chunk_size', 500),
+            metadata.get('chunk_overlap', 50)
+        )
+        result = self._add_chunk_stream(chunks, metadata, flush_size)
+        if result['success']:
+            result['total_characters'] = total_characters
+        return result
+    
+    def _iter_segment_chunks(
+        self, segments: Iterable[str], chunk_size: int, overlap: int
+    ) -> Iterator[str]:
+        """
+        Chunk text that arrives in pieces, matching chunk_text() on the joined text.
+        
+        Args:
+            segments (Iterable[str]): Successive pieces of the text
+            chunk_size (int): Maximum words per chunk
+            overlap (int): Number of overlapping words between chunks
+            
+        Yields:
+            str: Successive text chunks
+        """
+        if overlap >= chunk_size:
+            raise ValueError("chunk_overlap must be smaller than chunk_size")
+        
+        # Sliding word window: once it holds chunk_size words a chunk is
+        # emitted and the last `overlap` words carry over to the next one
+        words: List[str] = []
+        fresh_words = 0
+        
+        for segment in segments:
+            segment_words = segment.split()
+            words.extend(segment_words)
+            fresh_words += len(segment_words)
+            
+            while len(words) >= chunk_size:
+                yield ' '.join(words[:chunk_size])
+                words = words[chunk_size - overlap:]
+                fresh_words = len(words) - overlap
+        
+        if fresh_words > 0:
+            yield ' '.join(words)
+    
+    def _add_chunk_stream(
+        self, chunks: Iterable[str], metadata: Dict[str, Any], window: int
+    ) -> Dict[str, Any]:
+        """
+        Embed and write a document's chunks one window at a time.
+        
+        Args:
+            chunks (Iterable[str]): The document's chunks, in order
+            metadata (Dict[str, Any]): Document metadata
+            window (int): Chunks embedded and written per step
+            
+        Returns:
+            Dict[str, Any]: Result information
+        """
+        document_id = str(uuid.uuid4())
+        point_ids: List[str] = []
+        chunk_count_written = False
+        chunks = iter(chunks)
+        
+        try:
+            pending = list(islice(chunks, window))
+            while pending:
+                # Peek one chunk ahead: a document that fits in a single window
+                # knows its chunk count before the write
+                upcoming = next(chunks, None)
+                if upcoming is None and not point_ids:
+                    chunk_count_written = True
+                
+                payloads = self._build_payloads(
+                    pending,
+                    document_id,
+                    metadata,
+                    first_chunk_id=len(point_ids),
+                    chunk_count=len(pending) if chunk_count_written else None
                 )
-                points.append(point)
+                point_ids.extend(self._write_points(self._encode(pending), payloads))
+                self._point_index[document_id] = point_ids
+                
+                pending = [] if upcoming is None else [upcoming, *islice(chunks, window - 1)]
             
-            # Insert points into the database
-            self.client.upsert(
-                collection_name=self.collection_name,
-                points=points
-            )
+            if not point_ids:
+                return {
+                    'success': False,
+                    'error': 'No chunks generated from text',
+                    'chunks_added': 0
+                }
+            
+            # Otherwise the total is only known once the chunks are exhausted
+            if not chunk_count_written:
+                with self._write_lock:
+                    self.client.set_payload(
+                        collection_name=self.collection_name,
+                        payload={"chunk_count": len(point_ids)},
+                        points=point_ids
+                    )
             
-            logger.info(f"Successfully added {len(chunks)} chunks to vector database")
+            logger.info(f"Successfully added {len(point_ids)} chunks to vector database")
             
             return {
                 'success': True,
-                'chunks_added': len(chunks),
-                'document_id': document_id,
-                'total_characters': len(text)
+                'chunks_added': len(point_ids),
+                'document_id': document_id
             }
             
         except Exception as e:
             logger.error(f"Error adding document to vector database: {e}")
+            if point_ids:
+                self.delete_document(document_id)
             return {
                 'success': False,
                 'error': str(e),
                 'chunks_added': 0
             }
     
+    def _write_points(self, embeddings: np.ndarray, payloads: List[Dict[str, Any]]) -> List[str]:
+        """
+        Write points to the collection under fresh IDs.
+        
+        The points are upserted in batches of UPLOAD_BATCH_SIZE; against a
+        server, the batches of a large write are sent concurrently over the
+        existing client rather than through a process pool.
+        
+        Args:
+            embeddings (np.ndarray): Embedding row for each point
+            payloads (List[Dict[str, Any]]): Payload for each point
+            
+        Returns:
+            List[str]: IDs of the written points
+        """
+        ids = _random_uuids(len(payloads))
+        self._invalidate_search_cache()
+        def upsert(start: int) -> None:
+            end = start + UPLOAD_BATCH_SIZE
+            # qdrant-client 1.7 needs plain lists here: the Batch model coerces
+            # an ndarray element by element (about 3x slower than tolist()),
+            # and the local and gRPC converters reject unvalidated arrays. One
+            # tolist() per batch is the cheapest conversion
+            self.client.upsert(
+                collection_name=self.collection_name,
+                points=Batch(
+                    ids=ids[start:end],
+                    vectors=embeddings[start:end].tolist(),
+                    payloads=payloads[start:end]
+                )
+            )
+        
+        starts = range(0, len(ids), UPLOAD_BATCH_SIZE)
+        with self._write_lock:
+            if self._upload_pool is None or len(starts) == 1:
+                for start in starts:
+                    upsert(start)
+            else:
+                list(self._upload_pool.map(upsert, starts))
+        return ids
+    
+    def _build_payloads(
+        self,
+        chunks: List[str],
+        document_id: str,
+        metadata: Dict[str, Any],
+        first_chunk_id: int = 0,
+        chunk_count: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Build point payloads for consecutive chunks of one document.
+        
+        Args:
+            chunks (List[str]): Chunk texts
+            document_id (str): ID shared by all chunks of the document
+            metadata (Dict[str, Any]): Document metadata
+            first_chunk_id (int): Position of the first chunk within the document
+            chunk_count (Optional[int]): Total chunks in the document, if known
+            
+        Returns:
+            List[Dict[str, Any]]: One payload per chunk
+        """
+        # Only text and chunk_id vary between the chunks of a document
+        common_payload = {
+            "document_id": document_id,
+            "document_name": metadata.get("filename", "unknown"),
+            "file_type": metadata.get("file_type", "unknown"),
+            "upload_time": metadata.get("upload_time") or datetime.now().isoformat(),
+            "chunk_count": chunk_count,
+            **metadata.get("extra_metadata", {})
+        }
+        return [
+            {"text": chunk, "chunk_id": chunk_id, **common_payload}
+            for chunk_id, chunk in enumerate(chunks, first_chunk_id)
+        ]
+    
     def search_similar(
         self, 
         query: str, 
@@ -215,7 +898,17 @@ class VectorDatabase:
                 return []
             
             # Generate query embedding
-            query_embedding = self.embedding_model.encode([query])[0]
+            query_embedding = self._embed_query(query)
+            
+            filter_key = tuple(sorted(filter_conditions.items())) if filter_conditions else None
+            params_key = (limit, score_threshold, filter_key)
+            cache_key = (
+                hashlib.blake2b(query_embedding.tobytes(), digest_size=16).digest(),
+                params_key
+            )
+            cached = self._cached_results(cache_key, query_embedding, params_key)
+            if cached is not None:
+                return cached
             
             # Build filter if conditions provided
             search_filter = None
@@ -234,10 +927,11 @@ class VectorDatabase:
             # Perform search
             search_result = self.client.search(
                 collection_name=self.collection_name,
-                query_vector=query_embedding.tolist(),
+                query_vector=query_embedding,
                 limit=limit,
                 with_payload=True,
                 query_filter=search_filter,
+                search_params=SEARCH_PARAMS,
                 score_threshold=score_threshold
             )
             
@@ -254,6 +948,8 @@ class VectorDatabase:
                     "upload_time": result.payload.get("upload_time", "unknown")
                 })
             
+            self._store_results(cache_key, query_embedding, params_key, results)
+            
             logger.info(f"Found {len(results)} similar chunks for query: '{query[:50]}...'")
             return results
             
@@ -261,6 +957,124 @@ class VectorDatabase:
             logger.error(f"Error searching vector database: {e}")
             return []
     
+    def _embed_query(self, query: str) -> np.ndarray:
+        """
+        Embed a search query, reusing the embedding of a previously seen query.
+        
+        Args:
+            query (str): Search query
+            
+        Returns:
+            np.ndarray: Query embedding
+        """
+        # Runs of whitespace never change the tokens, but case does for cased
+        # models, so only whitespace is normalized
+        key = " ".join(query.split())
+        embedding = self._query_embed_cache.get(key)
+        if embedding is None:
+            # A single string skips the batching, length sorting and chunk cache
+            # lookups that _encode needs for documents
+            with torch.inference_mode():
+                embedding = self.embedding_model.encode(
+                    key,
+                    batch_size=1,
+                    show_progress_bar=False,
+                    convert_to_numpy=True,
+                    normalize_embeddings=True
+                ).astype(np.float32, copy=False)
+            self._query_embed_cache.set(key, embedding)
+        return embedding
+
+    def warm_query_embeddings(self, queries: List[str]) -> None:
+        """
+        Embed several search queries in one model call and cache the results.
+
+        Later search_similar calls for these queries then skip the model, so a
+        batch of questions costs a single forward pass instead of one each.
+
+        Args:
+            queries (List[str]): Search queries
+        """
+        keys = list(dict.fromkeys(" ".join(query.split()) for query in queries))
+        missing = [key for key in keys if key and self._query_embed_cache.get(key) is None]
+        if not missing:
+            return
+
+        with torch.inference_mode():
+            embeddings = self.embedding_model.encode(
+                missing,
+                batch_size=len(missing),
+                show_progress_bar=False,
+                convert_to_numpy=True,
+                normalize_embeddings=True
+            ).astype(np.float32, copy=False)
+        for key, embedding in zip(missing, embeddings):
+            self._query_embed_cache.set(key, embedding)
+
+    def _cached_results(
+        self, cache_key: Hashable, query_embedding: np.ndarray, params_key: Hashable
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Look up results for the same query, or failing that a near-identical one.
+        
+        Args:
+            cache_key (Hashable): Exact result cache key
+            query_embedding (np.ndarray): Query embedding
+            params_key (Hashable): Search parameters that must match exactly
+            
+        Returns:
+            Optional[List[Dict[str, Any]]]: Cached results, or None on a miss
+        """
+        results = self._result_cache.get(cache_key)
+        if results is not None:
+            return results
+        
+        with self._recent_lock:
+            recent = [(vector, key) for vector, params, key in self._recent_queries if params == params_key]
+        norm = np.linalg.norm(query_embedding)
+        if not recent or norm == 0:
+            return None
+        
+        similarities = np.stack([vector for vector, _ in recent]) @ (query_embedding / norm)
+        best = int(np.argmax(similarities))
+        if similarities[best] < NEAR_DUPLICATE_SIMILARITY:
+            return None
+        return self._result_cache.get(recent[best][1])
+    
+    def _store_results(
+        self,
+        cache_key: Hashable,
+        query_embedding: np.ndarray,
+        params_key: Hashable,
+        results: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Cache search results for exact and near-identical lookups.
+        
+        Args:
+            cache_key (Hashable): Exact result cache key
+            query_embedding (np.ndarray): Query embedding
+            params_key (Hashable): Search parameters the results were produced with
+            results (List[Dict[str, Any]]): Results to cache
+        """
+        norm = np.linalg.norm(query_embedding)
+        self._result_cache.set(cache_key, results)
+        if norm > 0:
+            with self._recent_lock:
+                self._recent_queries.append((query_embedding / norm, params_key, cache_key))
+    
+    def clear_cache(self) -> None:
+        """Drop all cached embeddings and search results held in memory."""
+        self._embed_cache.clear()
+        self._query_embed_cache.clear()
+        self._invalidate_search_cache()
+    
+    def _invalidate_search_cache(self) -> None:
+        """Drop cached search results after the collection changes."""
+        self._result_cache.clear()
+        with self._recent_lock:
+            self._recent_queries.clear()
+    
     def get_document_stats(self) -> Dict[str, Any]:
         """
         Get statistics about the documents in the database.
@@ -271,17 +1085,10 @@ class VectorDatabase:
         try:
             collection_info = self.client.get_collection(self.collection_name)
             
-            # Get unique documents
-            scroll_result = self.client.scroll(
-                collection_name=self.collection_name,
-                limit=1000,  # Adjust based on your needs
-                with_payload=True
-            )
-            
             documents = {}
             total_chunks = 0
             
-            for point in scroll_result[0]:
+            for point in self._scroll_all(STATS_PAYLOAD_FIELDS):
                 doc_id = point.payload.get("document_id", "unknown")
                 doc_name = point.payload.get("document_name", "unknown")
                 
@@ -312,6 +1119,29 @@ class VectorDatabase:
                 "documents": []
             }
     
+    def _scroll_all(self, payload_fields: List[str]) -> Iterator[Any]:
+        """
+        Iterate over every point in the collection, one page at a time.
+        
+        Args:
+            payload_fields (List[str]): Payload fields to fetch for each point
+            
+        Yields:
+            Record: Points without vectors
+        """
+        offset = None
+        while True:
+            records, offset = self.client.scroll(
+                collection_name=self.collection_name,
+                limit=SCROLL_PAGE_SIZE,
+                offset=offset,
+                with_payload=PayloadSelectorInclude(include=payload_fields),
+                with_vectors=False
+            )
+            yield from records
+            if offset is None:
+                break
+    
     def get_database_stats(self) -> Dict[str, Any]:
         """
         Get statistics about the documents in the database.
@@ -333,10 +1163,14 @@ class VectorDatabase:
             bool: True if successful, False otherwise
         """
         try:
-            # Delete points with matching document_id
-            self.client.delete(
-                collection_name=self.collection_name,
-                points_selector=Filter(
+            self._invalidate_search_cache()
+            
+            point_ids = self._point_index.pop(document_id, None)
+            if point_ids:
+                points_selector = PointIdsList(points=point_ids)
+            else:
+                # Delete points with matching document_id
+                points_selector = Filter(
                     must=[
                         FieldCondition(
                             key="document_id",
@@ -344,7 +1178,12 @@ class VectorDatabase:
                         )
                     ]
                 )
-            )
+            
+            with self._write_lock:
+                self.client.delete(
+                    collection_name=self.collection_name,
+                    points_selector=points_selector
+                )
             
             logger.info(f"Successfully deleted document: {document_id}")
             return True
@@ -353,17 +1192,31 @@ class VectorDatabase:
             logger.error(f"Error deleting document {document_id}: {e}")
             return False
     
-    def clear_database(self) -> bool:
+    def clear_database(self, hard: bool = False) -> bool:
         """
         Clear all documents from the database.
         
+        Args:
+            hard (bool): Drop and recreate the collection instead of deleting its points
+        
         Returns:
             bool: True if successful, False otherwise
         """
         try:
-            # Delete the collection and recreate it
-            self.client.delete_collection(self.collection_name)
-            self._initialize_collection()
+            self._invalidate_search_cache()
+            self._point_index.clear()
+            
+            with self._write_lock:
+                if hard:
+                    # Delete the collection and recreate it
+                    self.client.delete_collection(self.collection_name)
+                    self._initialize_collection()
+                else:
+                    # Deleting every point keeps the collection config and index allocation
+                    self.client.delete(
+                        collection_name=self.collection_name,
+                        points_selector=FilterSelector(filter=Filter(must=[]))
+                    )
             
             logger.info("Successfully cleared vector database")
             return True
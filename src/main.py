@@ -4,6 +4,10 @@ AI Research Assistant - Main Entry Point
 This module initializes and runs the AI Research Assistant application.
 """
 
+import atexit
+import logging
+import logging.handlers
+import queue
 import sys
 import os
 from pathlib import Path
@@ -16,8 +20,34 @@ from utils.config import load_config
 from core.research_assistant import ResearchAssistant
 
 
+def configure_logging(level: int = logging.INFO) -> None:
+    """
+    Send log records through a queue to a background writer thread.
+    
+    Request handlers then only enqueue records instead of formatting and
+    writing them under the stream handler's lock.
+    
+    Args:
+        level (int): Root logger level
+    """
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+    listener = logging.handlers.QueueListener(
+        log_queue, stream_handler, respect_handler_level=True
+    )
+    listener.start()
+    # Flushes the records still queued when the process exits
+    atexit.register(listener.stop)
+    
+    root = logging.getLogger()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(level)
+
+
 def main():
     """Main entry point for the application."""
+    configure_logging()
     print("🤖 Starting AI Research Assistant...")
     
     try:
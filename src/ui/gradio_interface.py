@@ -4,16 +4,137 @@ Gradio interface module for the AI Research Assistant.
 This module creates the web-based user interface using Gradio.
 """
 
+import asyncio
+import functools
+import time
 import gradio as gr
-from typing import List, Tuple, Any
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Tuple, TypeVar
 import logging
 
 from core.research_assistant import ResearchAssistant
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
+# Logging is configured by the application entry point
 logger = logging.getLogger(__name__)
 
+# Events processed at once; handlers await worker threads, so this is not
+# bounded by Gradio's thread pool
+HANDLER_CONCURRENCY_LIMIT = 16
+
+# Pending events held by the queue before new ones are rejected
+QUEUE_MAX_SIZE = 64
+
+# Concurrent API questions merged into one call of the batched endpoint
+MAX_API_BATCH_SIZE = 8
+
+# Static page text, defined once rather than on every create_interface call
+HEADER_MD = """
+# 🤖 AI Personal Research Assistant
+
+**Transform your documents into an intelligent knowledge base!** Upload PDFs, Word documents, or text files and have natural conversations about their content.
+
+---
+"""
+
+INSTRUCTIONS_MD = """
+### 💡 How to Use
+
+1. **Upload**: Select your documents using the file picker above
+2. **Process**: Click "Process Documents" to add them to the knowledge base
+3. **Chat**: Ask questions about your documents in the chat interface
+4. **Explore**: Use the database info to see what's been uploaded
+
+**Supported Formats**: PDF, DOCX, TXT files (up to 50MB each)
+"""
+
+EXAMPLES_MD = """
+**General Analysis:**
+- "What are the main themes in these documents?"
+- "Can you provide a summary of the key findings?"
+- "What are the most important conclusions?"
+
+**Comparative Analysis:**
+- "How do the approaches in document A compare to document B?"
+- "What are the similarities and differences between these papers?"
+
+**Specific Information:**
+- "What does the contract say about payment terms?"
+- "What methodology was used in the research?"
+- "Can you extract all the statistics mentioned?"
+
+**Research Questions:**
+- "What are the limitations mentioned in this study?"
+- "What future research directions are suggested?"
+- "What are the practical implications of these findings?"
+"""
+
+FOOTER_MD = """
+---
+
+<div style="text-align: center; color: #666; font-size: 14px;">
+    🔒 <strong>Privacy Note:</strong> Your documents are processed locally and stored in memory during this session.<br>
+    🤖 <strong>Powered by:</strong> Groq AI • Qdrant Vector DB • Sentence Transformers
+</div>
+"""
+
+# Built once and shared by every interface created in this process
+_THEME = gr.themes.Soft(
+    primary_hue="blue",
+    secondary_hue="gray",
+    neutral_hue="slate"
+)
+_DEMO_THEME = gr.themes.Soft()
+
+# Handlers marked fast_path that take longer than this are logged
+FAST_PATH_WARN_SECONDS = 0.05
+
+T = TypeVar("T")
+
+
+def fast_path(handler: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+    """
+    Mark an async handler as cheap enough to run outside the queue.
+    
+    Handlers using this should be registered with queue=False; a warning is
+    logged whenever one runs slower than FAST_PATH_WARN_SECONDS, so a
+    handler that has become expensive is noticed.
+    
+    Args:
+        handler (Callable[..., Awaitable[T]]): Async event handler
+        
+    Returns:
+        Callable[..., Awaitable[T]]: Wrapped handler
+    """
+    @functools.wraps(handler)
+    async def wrapper(*args: Any, **kwargs: Any) -> T:
+        start = time.perf_counter()
+        try:
+            return await handler(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            if elapsed > FAST_PATH_WARN_SECONDS:
+                logger.warning(
+                    f"Fast-path handler {handler.__name__} took {elapsed * 1000:.0f} ms"
+                )
+    return wrapper
+
+
+async def iterate_in_thread(iterator: Iterator[T]) -> AsyncIterator[T]:
+    """
+    Consume a blocking iterator from a worker thread without blocking the event loop.
+    
+    Args:
+        iterator (Iterator[T]): Blocking iterator, such as a token stream
+        
+    Yields:
+        T: Items of the iterator
+    """
+    done = object()
+    while True:
+        item = await asyncio.to_thread(next, iterator, done)
+        if item is done:
+            return
+        yield item
+
 
 def create_interface(research_assistant: ResearchAssistant) -> gr.Blocks:
     """
@@ -26,14 +147,18 @@ def create_interface(research_assistant: ResearchAssistant) -> gr.Blocks:
         gr.Blocks: Configured Gradio interface
     """
     
-    def upload_and_process_files(files: List[Any]) -> str:
-        """Handle file upload and processing."""
+    async def upload_and_process_files(files: List[Any], progress: gr.Progress = gr.Progress()) -> str:
+        """Handle file upload and processing, reporting each stage on the progress bar."""
         try:
             if not files:
                 return "📝 No files selected. Please upload some documents first."
             
             logger.info(f"Processing {len(files)} uploaded files")
-            result = research_assistant.process_documents(files)
+            result = await asyncio.to_thread(
+                research_assistant.process_documents,
+                files,
+                lambda fraction, description: progress(fraction, desc=description)
+            )
             return result
             
         except Exception as e:
@@ -41,36 +166,87 @@ def create_interface(research_assistant: ResearchAssistant) -> gr.Blocks:
             logger.error(error_msg)
             return f"❌ {error_msg}"
     
-    def chat_with_documents(message: str, history: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
-        """Handle chat interactions with documents."""
+    async def chat_with_documents(
+        message: str, history: List[Dict[str, str]], llm_history: List[Dict[str, str]]
+    ) -> AsyncIterator[Tuple[List[Dict[str, str]], Any, List[Dict[str, str]]]]:
+        """
+        Handle chat interactions with documents, streaming the answer as it is generated.
+        
+        The chatbot shows every turn, while llm_history holds what is sent to
+        the model: recent turns verbatim and older ones condensed into a memo.
+        
+        Yields (history, input, llm_history): the first update clears the input
+        box and later ones leave it untouched so the user can type the next question.
+        """
         try:
             if not message.strip():
-                return history + [("", "Please enter a question to get started.")]
+                yield history + [
+                    {"role": "assistant", "content": "Please enter a question to get started."}
+                ], "", llm_history
+                return
             
             logger.info(f"Processing chat query: '{message[:50]}...'")
             
-            # Generate response
-            response = research_assistant.generate_response(message, history)
+            # Add the turn immediately and fill in the answer as tokens arrive;
+            # Gradio sends each streamed update as a diff against the last one
+            history = history + [
+                {"role": "user", "content": message},
+                {"role": "assistant", "content": ""}
+            ]
+            yield history, "", llm_history
             
-            # Add to history
-            history.append((message, response))
-            return history
+            partial = ""
+            # Failures raise, so an error is never recorded as an answer in llm_history
+            stream = research_assistant.generate_response_stream(
+                message, llm_history, raise_errors=True
+            )
+            async for token in iterate_in_thread(stream):
+                partial += token
+                history[-1] = {"role": "assistant", "content": partial}
+                yield history, gr.update(), llm_history
+            
+            llm_history = llm_history + [
+                {"role": "user", "content": message},
+                {"role": "assistant", "content": partial.strip()}
+            ]
+            llm_history = await asyncio.to_thread(research_assistant.compact_history, llm_history)
+            yield history, gr.update(), llm_history
             
         except Exception as e:
             error_response = f"I apologize, but I encountered an error: {str(e)}"
             logger.error(f"Chat error: {e}")
-            history.append((message, error_response))
-            return history
+            error_message = {"role": "assistant", "content": error_response}
+            if len(history) >= 2 and history[-2] == {"role": "user", "content": message}:
+                history[-1] = error_message
+            else:
+                history = history + [{"role": "user", "content": message}, error_message]
+            yield history, gr.update(), llm_history
+    
+    async def answer_questions(questions: List[str]) -> Tuple[List[str]]:
+        """
+        Answer a batch of standalone questions for the API endpoint.
+        
+        Gradio merges concurrent requests into one call, so the queries share
+        a single embedding pass.
+        """
+        logger.info(f"Answering batch of {len(questions)} API questions")
+        try:
+            answers = await asyncio.to_thread(research_assistant.generate_responses, questions)
+        except Exception as e:
+            logger.error(f"Batch answer error: {e}")
+            answers = [f"I apologize, but I encountered an error: {str(e)}"] * len(questions)
+        return (answers,)
     
-    def clear_chat_history() -> List[Tuple[str, str]]:
-        """Clear the chat history."""
+    @fast_path
+    async def clear_chat_history() -> Tuple[List[Dict[str, str]], List[Dict[str, str]]]:
+        """Clear the chat history and the conversation memo."""
         logger.info("Chat history cleared")
-        return []
+        return [], []
     
-    def get_database_info() -> str:
+    async def get_database_info() -> str:
         """Get information about the current database state."""
         try:
-            stats = research_assistant.get_database_stats()
+            stats = await asyncio.to_thread(research_assistant.get_database_stats)
             
             if stats['total_documents'] == 0:
                 return "📊 **Database Status**: Empty\n\nNo documents have been uploaded yet. Upload some documents to get started!"
@@ -92,10 +268,10 @@ def create_interface(research_assistant: ResearchAssistant) -> gr.Blocks:
             logger.error(f"Error getting database info: {e}")
             return f"❌ Error retrieving database information: {str(e)}"
     
-    def clear_database() -> str:
+    async def clear_database() -> str:
         """Clear all documents from the database."""
         try:
-            success = research_assistant.clear_database()
+            success = await asyncio.to_thread(research_assistant.clear_database)
             if success:
                 logger.info("Database cleared successfully")
                 return "✅ **Database Cleared**\n\nAll documents have been removed from the knowledge base."
@@ -106,14 +282,20 @@ def create_interface(research_assistant: ResearchAssistant) -> gr.Blocks:
             logger.error(error_msg)
             return f"❌ **Error**: {error_msg}"
     
+    async def clear_cache() -> str:
+        """Clear cached embeddings, search results and answers."""
+        try:
+            await asyncio.to_thread(research_assistant.clear_cache)
+            return "✅ **Cache Cleared**\n\nCached embeddings and answers have been removed."
+        except Exception as e:
+            error_msg = f"Error clearing cache: {str(e)}"
+            logger.error(error_msg)
+            return f"❌ **Error**: {error_msg}"
+    
     # Create the Gradio interface
     with gr.Blocks(
         title="AI Research Assistant",
-        theme=gr.themes.Soft(
-            primary_hue="blue",
-            secondary_hue="gray",
-            neutral_hue="slate"
-        ),
+        theme=_THEME,
         css="""
         .gradio-container {
             max-width: 1200px !important;
@@ -129,13 +311,7 @@ def create_interface(research_assistant: ResearchAssistant) -> gr.Blocks:
         
         # Header
         gr.Markdown(
-            """
-            # 🤖 AI Personal Research Assistant
-            
-            **Transform your documents into an intelligent knowledge base!** Upload PDFs, Word documents, or text files and have natural conversations about their content.
-            
-            ---
-            """,
+            HEADER_MD,
             elem_classes=["header-markdown"]
         )
         
@@ -148,10 +324,12 @@ def create_interface(research_assistant: ResearchAssistant) -> gr.Blocks:
                 # File upload section
                 with gr.Group():
                     gr.Markdown("### Upload Documents")
+                    # Uploads arrive as paths to Gradio's temp files, never as bytes in memory
                     file_upload = gr.File(
                         label="Select Files",
                         file_count="multiple",
                         file_types=[".pdf", ".docx", ".txt"],
+                        type="filepath",
                         elem_classes=["upload-area"]
                     )
                     
@@ -177,6 +355,7 @@ def create_interface(research_assistant: ResearchAssistant) -> gr.Blocks:
                     with gr.Row():
                         info_btn = gr.Button("📊 View Database Info", size="sm")
                         clear_btn = gr.Button("🗑️ Clear Database", size="sm", variant="secondary")
+                        clear_cache_btn = gr.Button("🧹 Clear Cache", size="sm", variant="secondary")
                     
                     db_info = gr.Textbox(
                         label="Database Information",
@@ -188,16 +367,7 @@ def create_interface(research_assistant: ResearchAssistant) -> gr.Blocks:
                 
                 # Instructions
                 gr.Markdown(
-                    """
-                    ### 💡 How to Use
-                    
-                    1. **Upload**: Select your documents using the file picker above
-                    2. **Process**: Click "Process Documents" to add them to the knowledge base
-                    3. **Chat**: Ask questions about your documents in the chat interface
-                    4. **Explore**: Use the database info to see what's been uploaded
-                    
-                    **Supported Formats**: PDF, DOCX, TXT files (up to 50MB each)
-                    """,
+                    INSTRUCTIONS_MD,
                     elem_classes=["instructions"]
                 )
             
@@ -216,6 +386,7 @@ def create_interface(research_assistant: ResearchAssistant) -> gr.Blocks:
                 #     show_copy_button=True
                 # )
                 chatbot = gr.Chatbot(
+                    type="messages",
                     label="Research Assistant",
                     height=500,
                     show_label=False,
@@ -223,6 +394,9 @@ def create_interface(research_assistant: ResearchAssistant) -> gr.Blocks:
                     bubble_full_width=False,
                     show_copy_button=True
                 )
+                
+                # Conversation as sent to the model, kept per browser session
+                llm_history = gr.State([])
 
                 # Chat input
                 with gr.Row():
@@ -249,42 +423,21 @@ def create_interface(research_assistant: ResearchAssistant) -> gr.Blocks:
                 # Example questions
                 with gr.Accordion("💡 Example Questions", open=False):
                     gr.Markdown(
-                        """
-                        **General Analysis:**
-                        - "What are the main themes in these documents?"
-                        - "Can you provide a summary of the key findings?"
-                        - "What are the most important conclusions?"
-                        
-                        **Comparative Analysis:**
-                        - "How do the approaches in document A compare to document B?"
-                        - "What are the similarities and differences between these papers?"
-                        
-                        **Specific Information:**
-                        - "What does the contract say about payment terms?"
-                        - "What methodology was used in the research?"
-                        - "Can you extract all the statistics mentioned?"
-                        
-                        **Research Questions:**
-                        - "What are the limitations mentioned in this study?"
-                        - "What future research directions are suggested?"
-                        - "What are the practical implications of these findings?"
-                        """,
+                        EXAMPLES_MD,
                         elem_classes=["examples"]
                     )
         
         # Footer
         gr.Markdown(
-            """
-            ---
-            
-            <div style="text-align: center; color: #666; font-size: 14px;">
-                🔒 <strong>Privacy Note:</strong> Your documents are processed locally and stored in memory during this session.<br>
-                🤖 <strong>Powered by:</strong> Groq AI • Qdrant Vector DB • Sentence Transformers
-            </div>
-            """,
+            FOOTER_MD,
             elem_classes=["footer"]
         )
         
+        # Hidden components backing the batched API endpoint
+        api_question = gr.Textbox(visible=False)
+        api_answer = gr.Textbox(visible=False)
+        api_trigger = gr.Button(visible=False)
+        
         # Event handlers
         
         # File upload and processing
@@ -295,34 +448,44 @@ def create_interface(research_assistant: ResearchAssistant) -> gr.Blocks:
             show_progress=True
         )
         
-        # Chat interactions
+        # Chat interactions; the handler streams into the chatbot and clears
+        # the input with its first update
         send_btn.click(
             fn=chat_with_documents,
-            inputs=[chat_input, chatbot],
-            outputs=[chatbot],
-            show_progress=True
-        ).then(
-            lambda: "",  # Clear input after sending
-            outputs=[chat_input]
+            inputs=[chat_input, chatbot, llm_history],
+            outputs=[chatbot, chat_input, llm_history],
+            show_progress=True,
+            api_name="chat"
         )
         
         chat_input.submit(
             fn=chat_with_documents,
-            inputs=[chat_input, chatbot],
-            outputs=[chatbot],
-            show_progress=True
-        ).then(
-            lambda: "",  # Clear input after sending
-            outputs=[chat_input]
+            inputs=[chat_input, chatbot, llm_history],
+            outputs=[chatbot, chat_input, llm_history],
+            show_progress=True,
+            api_name=False
+        )
+        
+        # API-only endpoint; concurrent questions are answered as one batch.
+        # The chat above streams token by token, which batched events cannot do
+        api_trigger.click(
+            fn=answer_questions,
+            inputs=[api_question],
+            outputs=[api_answer],
+            batch=True,
+            max_batch_size=MAX_API_BATCH_SIZE,
+            api_name="ask"
         )
         
         # Clear chat
         clear_chat_btn.click(
             fn=clear_chat_history,
-            outputs=[chatbot]
+            outputs=[chatbot, llm_history],
+            queue=False
         )
         
-        # Database management
+        # Database management; these scan or rewrite the whole collection,
+        # so they stay queued
         info_btn.click(
             fn=get_database_info,
             outputs=[db_info],
@@ -335,12 +498,23 @@ def create_interface(research_assistant: ResearchAssistant) -> gr.Blocks:
             show_progress=True
         )
         
+        clear_cache_btn.click(
+            fn=clear_cache,
+            outputs=[db_info],
+            show_progress=True
+        )
+        
         # Auto-load database info on startup
         interface.load(
             fn=get_database_info,
             outputs=[db_info]
         )
     
+    interface.queue(
+        max_size=QUEUE_MAX_SIZE,
+        default_concurrency_limit=HANDLER_CONCURRENCY_LIMIT
+    )
+    
     return interface
 
 
@@ -351,7 +525,7 @@ def create_demo_interface() -> gr.Blocks:
     Returns:
         gr.Blocks: Demo Gradio interface
     """
-    with gr.Blocks(title="AI Research Assistant - Demo", theme=gr.themes.Soft()) as demo:
+    with gr.Blocks(title="AI Research Assistant - Demo", theme=_DEMO_THEME) as demo:
         gr.Markdown(
             """
             # 🤖 AI Research Assistant - Demo Mode
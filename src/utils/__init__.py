@@ -4,6 +4,7 @@ Utility modules for the AI Research Assistant.
 This package contains configuration management and helper functions.
 """
 
-from .config import ConfigManager, load_config
+from .cache import DiskCache, LRUCache, file_digest
+from .config import ConfigManager, file_suffix, load_config
 
-__all__ = ["ConfigManager", "load_config"]
\ No newline at end of file
+__all__ = ["ConfigManager", "file_suffix", "load_config", "DiskCache", "LRUCache", "file_digest"]
\ No newline at end of file
@@ -0,0 +1,301 @@
+"""
+Caching helpers for the AI Research Assistant.
+
+This module provides the bounded in-memory and SQLite-backed caches shared by
+the core modules.
+"""
+
+import hashlib
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Hashable, Iterable, List, Optional
+
+# Block size used when hashing files from disk
+HASH_BLOCK_SIZE = 1024 * 1024
+
+# Sentinel distinguishing a cache miss from a cached None
+_MISSING = object()
+
+# Keys per statement in bulk lookups, below SQLite's bound-parameter limit
+_SQL_BATCH_SIZE = 500
+
+# Buffered access-time updates written back in one transaction
+_ACCESS_FLUSH_SIZE = 256
+
+
+def file_digest(file_path: str, block_size: int = HASH_BLOCK_SIZE) -> str:
+    """
+    Compute a content fingerprint for a file.
+
+    Args:
+        file_path (str): Path to the file
+        block_size (int): Number of bytes read per iteration
+
+    Returns:
+        str: Hex digest of the file contents
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    with open(file_path, 'rb') as file:
+        for block in iter(lambda: file.read(block_size), b''):
+            hasher.update(block)
+    return hasher.hexdigest()
+
+
+class LRUCache:
+    """Thread-safe least-recently-used cache with an optional time-to-live."""
+
+    def __init__(self, maxsize: int = 128, ttl: Optional[float] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize (int): Maximum number of entries to keep
+            ttl (Optional[float]): Seconds before an entry expires (None to never expire)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a cached value and mark it as recently used.
+
+        Args:
+            key (Hashable): Cache key
+            default (Any): Value returned on a miss
+
+        Returns:
+            Any: Cached value or default
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+
+            stored_at, value = entry
+            if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+                del self._data[key]
+                return default
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value, evicting the least recently used entry if full.
+
+        Args:
+            key (Hashable): Cache key
+            value (Any): Value to store
+        """
+        if self.maxsize <= 0:
+            return
+
+        with self._lock:
+            self._data[key] = (time.monotonic(), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class DiskCache:
+    """Thread-safe persistent cache in a SQLite file, evicting least recently used entries."""
+
+    def __init__(self, path: str, max_size_mb: int = 1024, max_entries: int = 10000):
+        """
+        Initialize the cache, creating the database file if needed.
+
+        Args:
+            path (str): Path to the SQLite database file
+            max_size_mb (int): Maximum total size of the stored values in MB
+            max_entries (int): Maximum number of entries to keep
+        """
+        self.path = path
+        self.max_bytes = max_size_mb * 1024 * 1024
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        # Recency updates from lookups, flushed with the next write so reads
+        # do not each commit a transaction
+        self._pending_access: Dict[str, float] = {}
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        # Commits append to the write-ahead log and only the periodic
+        # checkpoint syncs the file; losing the newest entries in a power
+        # cut is fine for a cache
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, "
+                "size INTEGER NOT NULL, accessed REAL NOT NULL, expires REAL)"
+            )
+            # Files written before entries could expire lack the column
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(cache)")}
+            if "expires" not in columns:
+                self._conn.execute("ALTER TABLE cache ADD COLUMN expires REAL")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS cache_accessed ON cache (accessed)")
+            # Running totals let writes check the limits without scanning the
+            # table; they assume this instance is the file's only writer
+            self._count, self._total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache"
+            ).fetchone()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Get a cached value and mark it as recently used.
+
+        Args:
+            key (str): Cache key
+            default (Any): Value returned on a miss
+
+        Returns:
+            Any: Cached value or default
+        """
+        return self.get_many([key]).get(key, default)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """
+        Look up several keys at once.
+
+        Args:
+            keys (Iterable[str]): Cache keys
+
+        Returns:
+            Dict[str, Any]: Cached values for the keys that were found and have not expired
+        """
+        keys = list(keys)
+        found: Dict[str, Any] = {}
+        now = time.time()
+        with self._lock:
+            for i in range(0, len(keys), _SQL_BATCH_SIZE):
+                batch = keys[i:i + _SQL_BATCH_SIZE]
+                placeholders = ",".join("?" * len(batch))
+                # Expired entries are left for eviction to remove
+                rows = self._conn.execute(
+                    f"SELECT key, value FROM cache WHERE key IN ({placeholders}) "
+                    "AND (expires IS NULL OR expires > ?)",
+                    [*batch, now]
+                ).fetchall()
+                for key, value in rows:
+                    found[key] = pickle.loads(value)
+            if found:
+                self._pending_access.update(dict.fromkeys(found, now))
+                if len(self._pending_access) >= _ACCESS_FLUSH_SIZE:
+                    with self._conn:
+                        self._flush_access()
+        return found
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store a value, evicting least recently used entries if over the limits.
+
+        Args:
+            key (str): Cache key
+            value (Any): Picklable value to store
+            ttl (Optional[float]): Seconds before the entry expires (None to never expire)
+        """
+        self.set_many({key: value}, ttl)
+
+    def set_many(self, items: Dict[str, Any], ttl: Optional[float] = None) -> None:
+        """
+        Store several values in one transaction.
+
+        Args:
+            items (Dict[str, Any]): Picklable values by cache key
+            ttl (Optional[float]): Seconds before the entries expire (None to never expire)
+        """
+        if not items or self.max_entries <= 0 or self.max_bytes <= 0:
+            return
+
+        now = time.time()
+        expires = None if ttl is None else now + ttl
+        rows = []
+        for key, value in items.items():
+            blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            # A value larger than the whole cache would only evict everything else
+            if len(blob) <= self.max_bytes:
+                rows.append((key, blob, len(blob), now, expires))
+
+        if not rows:
+            return
+
+        with self._lock, self._conn:
+            # Eviction needs current recency, so buffered reads go out first
+            self._flush_access()
+            
+            # Entries being replaced no longer count towards the totals
+            count = len(rows)
+            total = sum(row[2] for row in rows)
+            keys = [row[0] for row in rows]
+            for i in range(0, len(keys), _SQL_BATCH_SIZE):
+                batch = keys[i:i + _SQL_BATCH_SIZE]
+                placeholders = ",".join("?" * len(batch))
+                replaced_count, replaced_size = self._conn.execute(
+                    f"SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache WHERE key IN ({placeholders})",
+                    batch
+                ).fetchone()
+                count -= replaced_count
+                total -= replaced_size
+            
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO cache (key, value, size, accessed, expires) VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+            self._count += count
+            self._total += total
+            self._evict()
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        with self._lock, self._conn:
+            self._pending_access.clear()
+            self._conn.execute("DELETE FROM cache")
+            self._count = self._total = 0
+
+    def _flush_access(self) -> None:
+        """Write buffered access times; the caller holds the lock and a transaction."""
+        if self._pending_access:
+            self._conn.executemany(
+                "UPDATE cache SET accessed = ? WHERE key = ?",
+                [(accessed, key) for key, accessed in self._pending_access.items()]
+            )
+            self._pending_access.clear()
+
+    def _evict(self) -> None:
+        """Delete the least recently used entries until the cache fits its limits."""
+        count, total = self._count, self._total
+        if count <= self.max_entries and total <= self.max_bytes:
+            return
+
+        # Walk the oldest entries, dropping them until both limits hold
+        victims: List[str] = []
+        for key, size in self._conn.execute("SELECT key, size FROM cache ORDER BY accessed"):
+            if count <= self.max_entries and total <= self.max_bytes:
+                break
+            victims.append(key)
+            count -= 1
+            total -= size
+        self._conn.executemany("DELETE FROM cache WHERE key = ?", [(key,) for key in victims])
+        self._count, self._total = count, total
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
@@ -4,20 +4,98 @@ Configuration management for the AI Research Assistant.
 This module handles loading and managing configuration settings.
 """
 
+import functools
 import os
+import threading
 from pathlib import Path
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional, Set, Tuple
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
-def load_config() -> Dict[str, Any]:
+
+def _env_bool(value: str) -> bool:
+    return value.lower() == "true"
+
+
+def _env_optional(value: Optional[str]) -> Optional[str]:
+    return value or None
+
+
+# (config key, environment variable, default, cast) for every optional setting
+_ENV_SETTINGS: Tuple[Tuple[str, str, Optional[str], Callable[[Any], Any]], ...] = (
+    # API Configuration
+    ("groq_model", "GROQ_MODEL", "llama3-8b-8192", str),
+    
+    # Server Configuration
+    ("server_name", "SERVER_NAME", "0.0.0.0", str),
+    ("server_port", "SERVER_PORT", "7860", int),
+    ("share", "SHARE", "false", _env_bool),
+    ("debug", "DEBUG", "true", _env_bool),
+    
+    # Vector Database Configuration
+    ("vector_db_path", "VECTOR_DB_PATH", "./data/vector_db", str),
+    ("qdrant_url", "QDRANT_URL", None, _env_optional),
+    ("qdrant_grpc_port", "QDRANT_GRPC_PORT", "6334", int),
+    ("collection_name", "COLLECTION_NAME", "documents", str),
+    ("embedding_model", "EMBEDDING_MODEL", "all-MiniLM-L6-v2", str),
+    ("embedding_quantization", "EMBEDDING_QUANTIZATION", None, _env_optional),
+    ("embedding_cache_size", "EMBEDDING_CACHE_SIZE", "4096", int),
+    
+    # Document Processing Configuration
+    ("chunk_size", "CHUNK_SIZE", "500", int),
+    ("chunk_overlap", "CHUNK_OVERLAP", "50", int),
+    ("max_file_size_mb", "MAX_FILE_SIZE_MB", "50", int),
+    ("stream_threshold_mb", "STREAM_THRESHOLD_MB", "20", int),
+    ("extraction_cache_size", "EXTRACTION_CACHE_SIZE", "32", int),
+    
+    # AI Configuration
+    ("max_tokens", "MAX_TOKENS", "1024", int),
+    ("temperature", "TEMPERATURE", "0.1", float),
+    ("top_k_results", "TOP_K_RESULTS", "5", int),
+    ("search_cache_size", "SEARCH_CACHE_SIZE", "256", int),
+    ("response_cache_size", "RESPONSE_CACHE_SIZE", "128", int),
+    ("cache_responses", "CACHE_RESPONSES", "false", _env_bool),
+    ("response_cache_ttl", "RESPONSE_CACHE_TTL", "86400", int),
+    ("preserve_prompt_cache", "PRESERVE_PROMPT_CACHE", "true", _env_bool),
+    ("stable_chunk_order", "STABLE_CHUNK_ORDER", "true", _env_bool),
+    
+    # Persistent Cache Configuration (embeddings and answers)
+    ("cache_size_mb", "CACHE_SIZE_MB", "1024", int),
+    ("cache_entries", "CACHE_ENTRIES", "10000", int),
+    
+    # Paths
+    ("data_dir", "DATA_DIR", "./data", Path),
+    ("upload_dir", "UPLOAD_DIR", "./data/uploads", Path),
+    ("cache_dir", "CACHE_DIR", "./data/cache", Path),
+)
+
+# Directories already created by this process
+_created_dirs: Set[Path] = set()
+_created_dirs_lock = threading.Lock()
+
+
+def _ensure_dirs(*dirs: Path) -> None:
+    """Create each directory once per process."""
+    with _created_dirs_lock:
+        for directory in dirs:
+            if directory not in _created_dirs:
+                directory.mkdir(exist_ok=True)
+                _created_dirs.add(directory)
+
+
+@functools.lru_cache(maxsize=1)
+def load_config() -> Mapping[str, Any]:
     """
     Load configuration from environment variables and defaults.
     
+    The environment is read once per process; call load_config.cache_clear()
+    to pick up changes.
+    
     Returns:
-        Dict[str, Any]: Configuration dictionary
+        Mapping[str, Any]: Read-only configuration mapping
         
     Raises:
         ValueError: If required environment variables are missing
@@ -30,42 +108,14 @@ def load_config() -> Dict[str, Any]:
             "Please set it in your .env file or environment."
         )
     
-    config = {
-        # API Configuration
-        "groq_api_key": groq_api_key,
-        "groq_model": os.getenv("GROQ_MODEL", "llama3-8b-8192"),
-        
-        # Server Configuration
-        "server_name": os.getenv("SERVER_NAME", "0.0.0.0"),
-        "server_port": int(os.getenv("SERVER_PORT", "7860")),
-        "share": os.getenv("SHARE", "false").lower() == "true",
-        "debug": os.getenv("DEBUG", "true").lower() == "true",
-        
-        # Vector Database Configuration
-        "vector_db_path": os.getenv("VECTOR_DB_PATH", "./data/vector_db"),
-        "collection_name": os.getenv("COLLECTION_NAME", "documents"),
-        "embedding_model": os.getenv("EMBEDDING_MODEL", "all-MiniLM-L6-v2"),
-        
-        # Document Processing Configuration
-        "chunk_size": int(os.getenv("CHUNK_SIZE", "500")),
-        "chunk_overlap": int(os.getenv("CHUNK_OVERLAP", "50")),
-        "max_file_size_mb": int(os.getenv("MAX_FILE_SIZE_MB", "50")),
-        
-        # AI Configuration
-        "max_tokens": int(os.getenv("MAX_TOKENS", "1024")),
-        "temperature": float(os.getenv("TEMPERATURE", "0.1")),
-        "top_k_results": int(os.getenv("TOP_K_RESULTS", "5")),
-        
-        # Paths
-        "data_dir": Path(os.getenv("DATA_DIR", "./data")),
-        "upload_dir": Path(os.getenv("UPLOAD_DIR", "./data/uploads")),
-    }
+    config: Dict[str, Any] = {"groq_api_key": groq_api_key}
+    for key, env_name, default, cast in _ENV_SETTINGS:
+        config[key] = cast(os.getenv(env_name, default))
     
     # Create necessary directories
-    config["data_dir"].mkdir(exist_ok=True)
-    config["upload_dir"].mkdir(exist_ok=True)
+    _ensure_dirs(config["data_dir"], config["upload_dir"])
     
-    return config
+    return MappingProxyType(config)
 
 
 def get_supported_file_types() -> Dict[str, str]:
@@ -101,6 +151,20 @@ def validate_file_size(file_path: str, max_size_mb: int = 50) -> bool:
         return False
 
 
+def file_suffix(filename: str) -> str:
+    """
+    Get the lowercase extension of a filename without building a Path.
+    
+    Args:
+        filename (str): Name of the file
+        
+    Returns:
+        str: Extension including the leading dot, or "" if there is none
+    """
+    _, dot, extension = filename.rpartition('.')
+    return f".{extension.lower()}" if dot else ""
+
+
 def validate_file_type(filename: str) -> bool:
     """
     Validate if file type is supported.
@@ -111,8 +175,7 @@ def validate_file_type(filename: str) -> bool:
     Returns:
         bool: True if file type is supported
     """
-    file_extension = Path(filename).suffix.lower()
-    return file_extension in get_supported_file_types()
+    return file_suffix(filename) in get_supported_file_types()
 
 
 class ConfigManager:
@@ -120,7 +183,8 @@ class ConfigManager:
     
     def __init__(self):
         """Initialize the configuration manager."""
-        self._config = load_config()
+        # A private copy, since the shared configuration is read-only
+        self._config = dict(load_config())
     
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -156,4 +220,5 @@ class ConfigManager:
     
     def reload(self) -> None:
         """Reload configuration from environment."""
-        self._config = load_config()
\ No newline at end of file
+        load_config.cache_clear()
+        self._config = dict(load_config())
\ No newline at end of file
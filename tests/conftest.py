@@ -0,0 +1,13 @@
+"""
+Shared pytest configuration for the AI Research Assistant tests.
+
+The application modules are imported the way main.py imports them, with
+src/ on the path.
+"""
+
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
@@ -0,0 +1,140 @@
+"""
+Tests for the in-memory and SQLite-backed caches.
+"""
+
+import sqlite3
+
+import pytest
+
+from utils import cache as cache_module
+from utils.cache import DiskCache, LRUCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace time.monotonic and time.time in the cache module with a settable clock."""
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(cache_module.time, "time", lambda: now[0])
+    return now
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert len(cache) == 2
+
+
+def test_lru_cache_expires_entries(clock):
+    cache = LRUCache(maxsize=4, ttl=10)
+    cache.set("a", 1)
+
+    clock[0] += 10
+    assert cache.get("a") == 1
+    clock[0] += 1
+    assert cache.get("a", "missing") == "missing"
+    assert len(cache) == 0
+
+
+def test_lru_cache_distinguishes_cached_none():
+    cache = LRUCache(maxsize=2)
+    cache.set("a", None)
+    assert "a" in cache
+    assert cache.get("a", "missing") is None
+
+
+def test_lru_cache_with_zero_size_stores_nothing():
+    cache = LRUCache(maxsize=0)
+    cache.set("a", 1)
+    assert cache.get("a") is None
+
+
+def test_disk_cache_round_trips_and_persists(tmp_path):
+    path = str(tmp_path / "cache.db")
+    cache = DiskCache(path)
+    cache.set_many({"a": [1, 2], "b": {"x": 1}})
+    assert cache.get("a") == [1, 2]
+    assert cache.get_many(["a", "b", "c"]) == {"a": [1, 2], "b": {"x": 1}}
+
+    reopened = DiskCache(path)
+    assert reopened.get("b") == {"x": 1}
+    assert len(reopened) == 2
+
+
+def test_disk_cache_entries_expire(tmp_path, clock):
+    cache = DiskCache(str(tmp_path / "cache.db"))
+    cache.set("short", "value", ttl=5)
+    cache.set("forever", "value")
+
+    clock[0] += 6
+    assert cache.get("short") is None
+    assert cache.get("forever") == "value"
+
+
+def test_disk_cache_replacing_a_key_keeps_totals(tmp_path):
+    cache = DiskCache(str(tmp_path / "cache.db"), max_entries=2)
+    cache.set("a", "x" * 100)
+    cache.set("a", "y")
+    cache.set("b", "z")
+
+    # Replacing "a" must not count it twice, or "b" would push it out
+    assert len(cache) == 2
+    assert cache.get("a") == "y"
+    count, total = cache._conn.execute("SELECT COUNT(*), SUM(size) FROM cache").fetchone()
+    assert (cache._count, cache._total) == (count, total)
+
+
+def test_disk_cache_evicts_least_recently_used(tmp_path, clock):
+    cache = DiskCache(str(tmp_path / "cache.db"), max_entries=2)
+    cache.set("a", 1)
+    clock[0] += 1
+    cache.set("b", 2)
+    clock[0] += 1
+    assert cache.get("a") == 1
+    clock[0] += 1
+    cache.set("c", 3)
+
+    assert cache.get_many(["a", "b", "c"]) == {"a": 1, "c": 3}
+
+
+def test_disk_cache_evicts_by_size(tmp_path, clock):
+    cache = DiskCache(str(tmp_path / "cache.db"), max_size_mb=1)
+    blob = b"x" * (400 * 1024)
+    for key in ("a", "b", "c"):
+        cache.set(key, blob)
+        clock[0] += 1
+
+    assert len(cache) == 2
+    assert cache._total <= cache.max_bytes
+    assert cache.get("a") is None
+
+
+def test_disk_cache_clear_resets_totals(tmp_path):
+    cache = DiskCache(str(tmp_path / "cache.db"))
+    cache.set_many({"a": 1, "b": 2})
+    cache.clear()
+
+    assert len(cache) == 0
+    assert (cache._count, cache._total) == (0, 0)
+
+
+def test_disk_cache_migrates_files_without_expiry(tmp_path):
+    path = str(tmp_path / "cache.db")
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE cache (key TEXT PRIMARY KEY, value BLOB NOT NULL, "
+        "size INTEGER NOT NULL, accessed REAL NOT NULL)"
+    )
+    conn.commit()
+    conn.close()
+
+    cache = DiskCache(path)
+    cache.set("a", 1, ttl=60)
+    assert cache.get("a") == 1
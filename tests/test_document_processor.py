@@ -0,0 +1,169 @@
+"""
+Tests for text extraction, streaming text blocks and PDF strategy selection.
+"""
+
+import pytest
+
+# Importing the core package also loads the embedding stack
+pytest.importorskip("torch")
+pytest.importorskip("sentence_transformers")
+
+from core import document_processor
+from core.document_processor import DocumentProcessor, InvalidPdfHeader, InvalidTextEncoding
+
+
+@pytest.fixture
+def processor():
+    processor = DocumentProcessor()
+    yield processor
+    processor.close()
+
+
+@pytest.fixture
+def small_blocks(monkeypatch):
+    """Read text files a few bytes at a time, so blocks split words and characters."""
+    monkeypatch.setattr(document_processor, "TEXT_READ_BLOCK_SIZE", 7)
+
+
+def write_bytes(tmp_path, name, data):
+    path = tmp_path / name
+    path.write_bytes(data)
+    return str(path)
+
+
+def test_text_blocks_rejoin_to_the_file_and_keep_words_whole(processor, tmp_path, monkeypatch):
+    # Every word fits in a block; multi-byte characters still straddle blocks
+    monkeypatch.setattr(document_processor, "TEXT_READ_BLOCK_SIZE", 16)
+    text = "naïve café\tword\r\nσύντομο κείμενο  with  spaces\n\nend"
+    path = write_bytes(tmp_path, "notes.txt", text.encode("utf-8"))
+
+    blocks = list(processor.iter_text_blocks(path))
+
+    assert "".join(blocks) == text
+    assert len(blocks) > 1
+    for block in blocks[:-1]:
+        assert block[-1].isspace()
+
+
+def test_text_block_without_whitespace_is_yielded_whole(processor, tmp_path, small_blocks):
+    path = write_bytes(tmp_path, "run.txt", b"x" * 30 + b" tail")
+
+    blocks = list(processor.iter_text_blocks(path))
+
+    assert "".join(blocks) == "x" * 30 + " tail"
+    assert max(len(block) for block in blocks) <= 14
+
+
+def test_invalid_utf8_reports_file_offset(processor, tmp_path, small_blocks):
+    data = "ünïcode ".encode("utf-8") * 3 + b"\xff rest"
+    path = write_bytes(tmp_path, "bad.txt", data)
+
+    with pytest.raises(InvalidTextEncoding) as excinfo:
+        list(processor.iter_text_blocks(path))
+
+    assert excinfo.value.position == data.index(b"\xff")
+
+
+def test_truncated_character_at_end_is_invalid(processor, tmp_path):
+    data = "end é".encode("utf-8")[:-1]
+    path = write_bytes(tmp_path, "cut.txt", data)
+
+    with pytest.raises(InvalidTextEncoding) as excinfo:
+        list(processor.iter_text_blocks(path))
+
+    assert excinfo.value.position == len(data) - 1
+
+
+def test_non_utf8_text_falls_back_to_detected_encoding(processor, tmp_path):
+    text = "Café prices – naïve estimates for the coöperative’s budget.\n" * 5
+    path = write_bytes(tmp_path, "legacy.txt", text.encode("cp1252"))
+
+    result = processor.extract_text(path, "legacy.txt")
+
+    assert result["success"]
+    assert result["text"] == text.strip()
+    assert result["metadata"]["encoding"] == "cp1252"
+
+
+def test_utf16_with_bom_is_decoded(processor, tmp_path):
+    path = write_bytes(tmp_path, "wide.txt", "Grüße aus Köln".encode("utf-16"))
+
+    result = processor.extract_text(path, "wide.txt")
+
+    assert result["success"]
+    assert result["text"] == "Grüße aus Köln"
+
+
+@pytest.mark.parametrize("text", [
+    "one line",
+    "\n\n  leading and trailing  \n\n\n",
+    "first\nsecond\n\nfourth\n",
+    "   \n\t\n",
+    "a\r\nb\r\nc",
+])
+def test_open_text_blocks_metadata_matches_extract_text(processor, tmp_path, small_blocks, text):
+    path = write_bytes(tmp_path, "doc.txt", text.encode("utf-8"))
+
+    extracted = processor._extract_txt_text(path)
+    with processor.open_text_blocks(path) as (blocks, metadata):
+        streamed = "".join(blocks)
+
+    assert streamed.strip() == extracted[0]
+    assert metadata == extracted[1]
+
+
+def test_open_text_blocks_rejects_invalid_utf8_before_yielding(processor, tmp_path):
+    path = write_bytes(tmp_path, "bad.txt", b"fine text \xff")
+
+    with pytest.raises(InvalidTextEncoding):
+        with processor.open_text_blocks(path):
+            pytest.fail("blocks should not be opened for an invalid file")
+
+
+def test_extraction_cache_follows_file_contents(processor, tmp_path):
+    path = tmp_path / "doc.txt"
+    path.write_text("first version", encoding="utf-8")
+    assert processor.extract_text(str(path), "doc.txt")["text"] == "first version"
+
+    path.write_text("second version", encoding="utf-8")
+    assert processor.extract_text(str(path), "doc.txt")["text"] == "second version"
+
+
+def test_extraction_cache_is_keyed_by_file_type(processor, tmp_path):
+    path = write_bytes(tmp_path, "doc.txt", b"plain text, not a PDF")
+    assert processor.extract_text(path, "doc.txt")["success"]
+
+    result = processor.extract_text(path, "doc.pdf")
+    assert not result["success"]
+    assert result["error"] == str(InvalidPdfHeader(path))
+
+
+def test_unsupported_type_is_rejected(processor, tmp_path):
+    path = write_bytes(tmp_path, "image.png", b"\x89PNG")
+
+    result = processor.extract_text(path, "image.png")
+
+    assert not result["success"]
+    assert result["error"] == "Unsupported file type: .png"
+
+
+@pytest.mark.parametrize("num_pages, workers, strategy", [
+    (1, 8, "seq"),
+    (document_processor.THREAD_PAGE_THRESHOLD - 1, 8, "seq"),
+    (document_processor.THREAD_PAGE_THRESHOLD, 8, "threads"),
+    (document_processor.PROCESS_PAGE_THRESHOLD, 8, "threads"),
+    (document_processor.PROCESS_PAGE_THRESHOLD + 1, 8, "procs"),
+    (document_processor.PROCESS_PAGE_THRESHOLD + 1, 1, "seq"),
+])
+def test_pdf_strategy_selection(num_pages, workers, strategy):
+    processor = DocumentProcessor(max_pdf_workers=workers)
+    assert processor._choose_pdf_strategy(num_pages) == strategy
+
+
+@pytest.mark.parametrize("num_pages, parts", [(1, 4), (10, 3), (501, 8), (8, 8)])
+def test_split_page_range_covers_every_page_once(num_pages, parts):
+    ranges = document_processor._split_page_range(num_pages, parts)
+
+    pages = [page for start, end in ranges for page in range(start, end)]
+    assert pages == list(range(num_pages))
+    assert len(ranges) <= parts
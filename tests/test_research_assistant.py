@@ -0,0 +1,103 @@
+"""
+Tests for routing uploads between streamed and buffered ingestion.
+"""
+
+import pytest
+
+pytest.importorskip("groq")
+pytest.importorskip("torch")
+pytest.importorskip("sentence_transformers")
+
+from core import vector_database
+from core.research_assistant import ResearchAssistant
+from utils.config import ConfigManager, load_config
+
+from test_vector_database import FakeEncoder
+
+
+@pytest.fixture
+def make_assistant(monkeypatch, tmp_path):
+    monkeypatch.setattr(vector_database, "SentenceTransformer", FakeEncoder)
+    monkeypatch.setenv("GROQ_API_KEY", "test-key")
+    monkeypatch.setenv("DATA_DIR", str(tmp_path / "data"))
+    monkeypatch.setenv("UPLOAD_DIR", str(tmp_path / "data" / "uploads"))
+    load_config.cache_clear()
+
+    def make(stream_threshold_mb):
+        config = ConfigManager()
+        for key, value in {
+            "vector_db_path": ":memory:",
+            "cache_size_mb": 0,
+            "chunk_size": 20,
+            "chunk_overlap": 5,
+            "stream_threshold_mb": stream_threshold_mb,
+        }.items():
+            config.update(key, value)
+        return ResearchAssistant(config)
+
+    yield make
+    load_config.cache_clear()
+
+
+@pytest.fixture
+def extractions(monkeypatch):
+    """Record the files passed through full extraction."""
+    names = []
+    original = ResearchAssistant._extract_document
+
+    def recording(self, file_path, filename, *args, **kwargs):
+        names.append(filename)
+        return original(self, file_path, filename, *args, **kwargs)
+
+    monkeypatch.setattr(ResearchAssistant, "_extract_document", recording)
+    return names
+
+
+def stored_payloads(assistant):
+    points, _ = assistant.vector_db.client.scroll(
+        collection_name=assistant.vector_db.collection_name, limit=10000, with_payload=True
+    )
+    return [point.payload for point in points]
+
+
+def test_large_utf8_text_is_streamed_with_buffered_metadata(make_assistant, extractions, tmp_path):
+    text = "\n\n  The quick brown fox\n jumps over the lazy dog. " * 200 + "\n\n"
+    path = tmp_path / "notes.txt"
+    path.write_text(text, encoding="utf-8")
+    buffered = make_assistant(20).doc_processor.extract_text(str(path), "notes.txt")
+
+    assistant = make_assistant(0)
+    status = assistant.process_single_document(str(path), "notes.txt")
+
+    assert status.startswith("✅")
+    assert extractions == []
+    payloads = stored_payloads(assistant)
+    assert len(payloads) == len(assistant.vector_db.chunk_text(buffered["text"], 20, 5))
+    for field in ("encoding", "lines", "method", "file_type"):
+        assert payloads[0][field] == {**buffered["metadata"], "file_type": ".txt"}[field]
+
+
+def test_non_utf8_text_falls_back_to_buffered_extraction(make_assistant, extractions, tmp_path):
+    path = tmp_path / "legacy.txt"
+    path.write_bytes(("Café très bien – déjà vu. " * 200).encode("cp1252"))
+
+    assistant = make_assistant(0)
+    status = assistant.process_single_document(str(path), "legacy.txt")
+
+    assert status.startswith("✅")
+    assert extractions == ["legacy.txt"]
+    payloads = stored_payloads(assistant)
+    assert {payload["encoding"] for payload in payloads} == {"cp1252"}
+    assert len({payload["document_id"] for payload in payloads}) == 1
+
+
+def test_small_files_are_extracted_whole(make_assistant, extractions, tmp_path):
+    path = tmp_path / "short.txt"
+    path.write_text("A short note about foxes.", encoding="utf-8")
+
+    assistant = make_assistant(20)
+    status = assistant.process_single_document(str(path), "short.txt")
+
+    assert status.startswith("✅")
+    assert extractions == ["short.txt"]
+    assert len(stored_payloads(assistant)) == 1
@@ -0,0 +1,163 @@
+"""
+Tests for chunking, streamed document writes and search result caching.
+
+The embedding model is replaced by a deterministic bag-of-words encoder, so
+no model is downloaded and similar texts get similar vectors.
+"""
+
+import hashlib
+
+import numpy as np
+import pytest
+
+pytest.importorskip("torch")
+pytest.importorskip("sentence_transformers")
+
+from core import vector_database
+from core.vector_database import VectorDatabase
+
+
+class FakeEncoder:
+    """Stand-in for SentenceTransformer hashing each word into one dimension."""
+
+    dimension = 384
+
+    def __init__(self, model_name, device="cpu"):
+        self.calls = 0
+
+    def get_sentence_embedding_dimension(self):
+        return self.dimension
+
+    def encode(self, sentences, normalize_embeddings=False, **kwargs):
+        self.calls += 1
+        single = isinstance(sentences, str)
+        rows = np.zeros((1 if single else len(sentences), self.dimension), dtype=np.float32)
+        for row, sentence in zip(rows, [sentences] if single else sentences):
+            for word in sentence.lower().split():
+                row[int(hashlib.md5(word.encode()).hexdigest(), 16) % self.dimension] += 1
+            norm = np.linalg.norm(row)
+            if normalize_embeddings and norm:
+                row /= norm
+        return rows[0] if single else rows
+
+
+@pytest.fixture
+def db(monkeypatch):
+    monkeypatch.setattr(vector_database, "SentenceTransformer", FakeEncoder)
+    return VectorDatabase()
+
+
+def words(count, prefix="w"):
+    return " ".join(f"{prefix}{i}" for i in range(count))
+
+
+def point_count(db):
+    return db.client.count(collection_name=db.collection_name).count
+
+
+@pytest.mark.parametrize("chunk_size, overlap", [(10, 10), (10, 11)])
+def test_iter_chunks_rejects_overlap_not_below_chunk_size(db, chunk_size, overlap):
+    with pytest.raises(ValueError):
+        list(db.iter_chunks(words(50), chunk_size, overlap))
+    with pytest.raises(ValueError):
+        list(db._iter_segment_chunks([words(50)], chunk_size, overlap))
+
+
+def test_iter_chunks_overlap_and_coverage(db):
+    tokens = words(23).split()
+
+    chunks = db.chunk_text(" ".join(tokens), chunk_size=10, overlap=3)
+
+    # Windows advance by chunk_size - overlap and stop at the one reaching the last word
+    assert chunks == [" ".join(tokens[start:start + 10]) for start in (0, 7, 14)]
+
+
+def test_short_and_blank_text(db):
+    assert db.chunk_text("  only a few words  ", chunk_size=10, overlap=2) == ["  only a few words  "]
+    assert db.chunk_text(" \n\t ", chunk_size=10, overlap=2) == []
+
+
+@pytest.mark.parametrize("count", [1, 9, 10, 11, 17, 24, 25, 100])
+@pytest.mark.parametrize("piece", [1, 3, 10, 1000])
+def test_segment_chunks_match_chunk_text(db, count, piece):
+    tokens = words(count).split()
+    text = " ".join(tokens)
+    segments = [" ".join(tokens[i:i + piece]) + " " for i in range(0, count, piece)]
+
+    streamed = list(db._iter_segment_chunks(segments, 10, 3))
+
+    assert streamed == [" ".join(chunk.split()) for chunk in db.chunk_text(text, 10, 3)]
+
+
+def test_add_document_stream_writes_every_chunk(db):
+    pages = [words(40, prefix=f"p{page}_") for page in range(5)]
+
+    result = db.add_document_stream(
+        pages, {"filename": "paper.pdf", "file_type": ".pdf", "chunk_size": 20, "chunk_overlap": 5},
+        flush_size=2
+    )
+
+    assert result["success"]
+    assert result["total_characters"] == sum(len(page) for page in pages)
+    assert point_count(db) == result["chunks_added"] == len(db.chunk_text(" ".join(pages), 20, 5))
+    points, _ = db.client.scroll(collection_name=db.collection_name, limit=100, with_payload=True)
+    assert {point.payload["chunk_count"] for point in points} == {result["chunks_added"]}
+
+
+def test_failed_stream_removes_written_chunks(db):
+    def pages():
+        for page in range(4):
+            yield words(40, prefix=f"p{page}_")
+        raise OSError("disk read failed")
+
+    result = db.add_document_stream(
+        pages(), {"filename": "broken.pdf", "chunk_size": 20, "chunk_overlap": 5}, flush_size=2
+    )
+
+    assert not result["success"]
+    assert result["chunks_added"] == 0
+    assert "disk read failed" in result["error"]
+    assert point_count(db) == 0
+    assert db._point_index == {}
+
+
+def test_failed_stream_keeps_other_documents(db):
+    kept = db.add_document(words(30), {"filename": "kept.txt", "chunk_size": 20, "chunk_overlap": 5})
+
+    def pages():
+        yield words(60, prefix="x")
+        raise OSError("disk read failed")
+
+    db.add_document_stream(pages(), {"filename": "broken.pdf", "chunk_size": 20, "chunk_overlap": 5}, flush_size=1)
+
+    assert point_count(db) == kept["chunks_added"]
+
+
+def test_search_results_are_cached(db):
+    db.add_document("alpha beta gamma", {"filename": "a.txt"})
+    first = db.search_similar("alpha beta")
+    calls = db.embedding_model.calls
+
+    assert db.search_similar("alpha   beta") == first
+    assert db.embedding_model.calls == calls
+
+
+def test_writes_invalidate_cached_search_results(db):
+    db.add_document("alpha beta gamma", {"filename": "a.txt"})
+    assert [r["document_name"] for r in db.search_similar("delta epsilon")] == ["a.txt"]
+
+    added = db.add_document("delta epsilon zeta", {"filename": "b.txt"})
+    assert db.search_similar("delta epsilon")[0]["document_name"] == "b.txt"
+
+    db.delete_document(added["document_id"])
+    assert [r["document_name"] for r in db.search_similar("delta epsilon")] == ["a.txt"]
+
+
+def test_chunk_embeddings_are_reused(db):
+    db.add_document("repeated text", {"filename": "a.txt"})
+    calls = db.embedding_model.calls
+
+    db.add_document("repeated text", {"filename": "b.txt"})
+
+    assert db.embedding_model.calls == calls
+    assert point_count(db) == 2